@@ -1,6 +1,5 @@
 """Yoto integration."""
 
-import asyncio
 import logging
 
 from homeassistant.config_entries import ConfigEntry
@@ -16,9 +15,11 @@ from homeassistant.helpers.device_registry import DeviceEntry
 from homeassistant.helpers.typing import ConfigType
 from yoto_api import AuthenticationError
 
-from .const import CONF_TOKEN, DOMAIN
+from .artwork import async_setup_artwork
+from .const import CONF_TOKEN
 from .coordinator import YotoConfigEntry, YotoDataUpdateCoordinator
-from .media_source import YotoMediaSource
+from .library_index import DATA_LIBRARY_INDEX, YotoLibraryIndex
+from .library_store import YotoLibraryStore
 from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
@@ -37,6 +38,8 @@ PLATFORMS: list[str] = [
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Yoto component."""
     async_setup_services(hass)
+    await async_setup_artwork(hass)
+    hass.data[DATA_LIBRARY_INDEX] = YotoLibraryIndex(hass)
     return True
 
 
@@ -45,7 +48,6 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: YotoConfigEntry)
     coordinator = YotoDataUpdateCoordinator(hass, config_entry)
     try:
         await coordinator.async_config_entry_first_refresh()
-        await asyncio.sleep(3)
     except AuthenticationError as ex:
         _LOGGER.error(f"Authentication error: {ex}")
         raise ConfigEntryAuthFailed from ex
@@ -59,15 +61,25 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: YotoConfigEntry)
         hass.config_entries.async_update_entry(config_entry, data=new_data)
 
     hass.bus.async_listen_once("homeassistant_stop", _handle_shutdown)
+    config_entry.async_on_unload(config_entry.add_update_listener(_async_reload_entry))
 
     await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
 
-    hass.data.setdefault("media_source", {})
-    hass.data["media_source"][DOMAIN] = YotoMediaSource(hass)
+    library_index = hass.data[DATA_LIBRARY_INDEX]
+    library_index.add_coordinator(coordinator)
+    config_entry.async_on_unload(lambda: library_index.remove_coordinator(coordinator))
 
     return True
 
 
+async def _async_reload_entry(hass: HomeAssistant, entry: YotoConfigEntry) -> None:
+    """Reload the entry when its options change."""
+    if dict(entry.options) == entry.runtime_data.setup_options:
+        # Data updates, such as a rotated refresh token being stored.
+        return
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: YotoConfigEntry) -> bool:
     """Handle removal of an entry."""
     coordinator = entry.runtime_data
@@ -82,6 +94,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: YotoConfigEntry) -> boo
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: YotoConfigEntry) -> None:
+    """Delete the cached library when an entry is removed."""
+    await YotoLibraryStore(hass, entry.entry_id, {}).async_remove()
+
+
 async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Migrate old entry."""
     if entry.version < 2:
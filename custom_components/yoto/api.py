@@ -0,0 +1,313 @@
+"""Async transport for the Yoto cloud API."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from datetime import timedelta
+from functools import partial
+from typing import Any
+
+from aiohttp import ClientError, ClientResponseError
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util import dt as dt_util
+from yoto_api import (
+    AuthenticationError,
+    Token,
+    YotoAPI,
+    YotoManager,
+    YotoMQTTClient,
+    YotoPlayer,
+    YotoPlayerConfig,
+)
+from yoto_api.Card import Card
+from yoto_api.const import POWER_SOURCE
+from yoto_api.utils import get_raw_value
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+USER_AGENT = "Yoto/2.73 (com.yotoplay.Yoto; build:10405; iOS 17.4.0) Alamofire/5.6.4"
+
+# A refresh token that was revoked or expired is rejected with invalid_grant,
+# which Auth0 sends with one of these statuses.
+TOKEN_REJECTED_STATUSES = frozenset({400, 401, 403})
+
+
+def _apply_status(player: YotoPlayer, status: dict[str, Any]) -> None:
+    """Apply a /device-v2/{id}/status body to a player.
+
+    Mirrors the status part of YotoAPI.update_players, which cannot be used
+    on its own since it also parses the device list and config.
+    """
+    player.online = bool(status.get("isOnline"))
+    player.last_updated_api = dt_util.utcnow()
+    player.active_card = status.get("activeCard")
+    player.is_playing = player.active_card != "none"
+    player.ambient_light_sensor_reading = status.get("ambientLightSensorReading")
+    player.day_mode_on = status.get("dayMode")
+    player.user_volume = status.get("userVolumePercentage")
+    player.system_volume = status.get("systemVolumePercentage")
+    if player.battery_level_percentage is None:
+        # Kept up to date over MQTT once known.
+        player.battery_level_percentage = status.get("batteryLevelPercentage")
+    temperature = status.get("temperatureCelcius")
+    if temperature not in (None, "notSupported") and int(temperature) != 0:
+        player.temperature_celcius = temperature
+    player.bluetooth_audio_connected = status.get("isBluetoothAudioConnected")
+    player.charging = status.get("isCharging")
+    player.audio_device_connected = status.get("isAudioDeviceConnected")
+    player.firmware_version = status.get("firmwareVersion")
+    player.wifi_strength = status.get("wifiStrength")
+    player.playing_source = status.get("playingSource")
+    player.night_light_mode = status.get("nightlightMode")
+    player.power_source = POWER_SOURCE.get(status.get("powerSource"))
+
+
+class _PrefetchedYotoAPI(YotoAPI):
+    """YotoAPI that parses responses already fetched over aiohttp.
+
+    yoto_api couples its blocking requests calls with response parsing, so the
+    parsing is reused by answering its fetch helpers from prefetched JSON.
+    """
+
+    def __init__(self, client_id: str, responses: dict[str, Any]) -> None:
+        """Initialize with the prefetched responses."""
+        super().__init__(client_id=client_id)
+        self._responses = responses
+
+    def _get_devices(self, token: Token) -> dict:
+        return self._responses["devices"]
+
+    def _get_device_status(self, token: Token, player_id: str) -> dict:
+        return self._responses[f"status/{player_id}"]
+
+    def _get_device_config(self, token: Token, player_id: str) -> dict:
+        return self._responses[f"config/{player_id}"]
+
+    def _get_cards(self, token: Token) -> dict:
+        return self._responses["cards"]
+
+    def _get_card_detail(self, token: Token, cardid: str) -> dict:
+        return self._responses[f"card/{cardid}"]
+
+
+class YotoEventsClient(YotoMQTTClient):
+    """MQTT client that tells the callback the player and topic of a message."""
+
+    def _on_message(self, client: Any, userdata: Any, message: Any) -> None:
+        players, callback = userdata
+        parts = message.topic.split("/")
+        if callback is not None and len(parts) >= 4:
+            callback = partial(callback, parts[1], parts[3])
+        super()._on_message(client, (players, callback), message)
+
+
+class YotoApiClient:
+    """Run Yoto REST calls on the event loop using the shared aiohttp session."""
+
+    def __init__(self, hass: HomeAssistant, yoto_manager: YotoManager) -> None:
+        """Initialize."""
+        self._session = async_get_clientsession(hass)
+        self._yoto_manager = yoto_manager
+
+    @property
+    def _api(self) -> YotoAPI:
+        return self._yoto_manager.api
+
+    def _headers(self) -> dict[str, str]:
+        token = self._yoto_manager.token
+        return {
+            "User-Agent": USER_AGENT,
+            "Content-Type": "application/json",
+            "Authorization": f"{token.token_type} {token.access_token}",
+        }
+
+    async def _async_request(
+        self, method: str, path: str, payload: dict | None = None
+    ) -> Any:
+        """Send an authenticated request and return the decoded JSON body."""
+        try:
+            async with self._session.request(
+                method,
+                self._api.BASE_URL + path,
+                headers=self._headers(),
+                data=json.dumps(payload) if payload is not None else None,
+                raise_for_status=True,
+            ) as response:
+                return await response.json(content_type=None)
+        except ClientResponseError as ex:
+            if ex.status == 401:
+                raise AuthenticationError(f"Request to {path} was rejected") from ex
+            raise
+
+    def _parser(self, responses: dict[str, Any]) -> YotoAPI:
+        return _PrefetchedYotoAPI(self._yoto_manager.client_id, responses)
+
+    async def async_refresh_token(self) -> Token:
+        """Exchange the refresh token for a new access token.
+
+        Raises AuthenticationError only when the refresh token itself is
+        rejected; server errors, rate limiting and malformed responses raise
+        ClientError so they are retried instead of starting reauth.
+        """
+        token = self._yoto_manager.token
+        async with self._session.post(
+            self._api.TOKEN_URL,
+            data={
+                "client_id": self._api.CLIENT_ID,
+                "grant_type": "refresh_token",
+                "refresh_token": token.refresh_token,
+                "audience": self._api.BASE_URL,
+            },
+        ) as response:
+            try:
+                body = await response.json(content_type=None)
+            except ValueError:
+                body = None
+        error = body.get("error") if isinstance(body, dict) else None
+        if response.status in TOKEN_REJECTED_STATUSES and error == "invalid_grant":
+            raise AuthenticationError("Refresh token invalid")
+        if response.status >= 400 or error:
+            raise ClientError(
+                f"Token refresh failed with status {response.status}: {error}"
+            )
+        try:
+            self._yoto_manager.token = Token(
+                access_token=body["access_token"],
+                refresh_token=body.get("refresh_token", token.refresh_token),
+                token_type=body["token_type"],
+                scope=token.scope,
+                valid_until=dt_util.utcnow() + timedelta(seconds=body["expires_in"]),
+            )
+        except (KeyError, TypeError, ValueError) as ex:
+            raise ClientError(f"Token refresh returned an unusable body: {ex}") from ex
+        _LOGGER.debug(f"{DOMAIN} - Access token refreshed")
+        return self._yoto_manager.token
+
+    async def async_update_players_status(self) -> None:
+        """Fetch device, status and config data for every player."""
+        responses: dict[str, Any] = {
+            "devices": await self._async_request("GET", "/device-v2/devices/mine")
+        }
+        keys = [
+            (kind, device["deviceId"])
+            for device in responses["devices"]["devices"]
+            for kind in ("status", "config")
+        ]
+        results = await asyncio.gather(
+            *(
+                self._async_request("GET", f"/device-v2/{player_id}/{kind}")
+                for kind, player_id in keys
+            )
+        )
+        responses.update(
+            (f"{kind}/{player_id}", result)
+            for (kind, player_id), result in zip(keys, results)
+        )
+        self._parser(responses).update_players(
+            self._yoto_manager.token, self._yoto_manager.players
+        )
+        if self._yoto_manager.mqtt_client:
+            for player_id in self._yoto_manager.players:
+                self._yoto_manager.mqtt_client.update_status(player_id)
+
+    async def async_update_status(self, player_ids: list[str]) -> None:
+        """Refresh the status, but not the config, of specific players.
+
+        Players found online are also asked to publish their status over MQTT.
+        A player whose request fails keeps its previous status.
+        """
+        results = await asyncio.gather(
+            *(
+                self._async_request("GET", f"/device-v2/{player_id}/status")
+                for player_id in player_ids
+            ),
+            return_exceptions=True,
+        )
+        auth_error: AuthenticationError | None = None
+        for player_id, status in zip(player_ids, results):
+            if isinstance(status, AuthenticationError):
+                auth_error = status
+                continue
+            if isinstance(status, (ClientError, TimeoutError)):
+                _LOGGER.debug(f"{DOMAIN} - Status of {player_id} failed: {status}")
+                continue
+            if isinstance(status, BaseException):
+                raise status
+            player = self._yoto_manager.players[player_id]
+            _apply_status(player, status)
+            if player.online and self._yoto_manager.mqtt_client:
+                self._yoto_manager.mqtt_client.update_status(player_id)
+        if auth_error is not None:
+            raise auth_error
+
+    async def async_update_library(self) -> dict[str, str | None]:
+        """Fetch the family library listing.
+
+        Returns each card's content update marker, which changes whenever the
+        card's chapters or tracks are edited.
+        """
+        responses = {"cards": await self._async_request("GET", "/card/family/library")}
+        self._parser(responses).update_library(
+            self._yoto_manager.token, self._yoto_manager.library
+        )
+        return {
+            item["cardId"]: get_raw_value(item, "card.updatedAt")
+            or item.get("updatedAt")
+            for item in responses["cards"]["cards"]
+        }
+
+    async def async_update_card_detail(self, card_id: str) -> None:
+        """Fetch chapters and tracks for a card."""
+        library = self._yoto_manager.library
+        responses = {
+            f"card/{card_id}": await self._async_request("GET", f"/card/{card_id}")
+        }
+        if card_id not in library:
+            library[card_id] = Card(id=card_id)
+        # Parse into a fresh card so refetched tracks pick up new signed URLs,
+        # then swap the chapters in one step.
+        detail = Card(id=card_id)
+        self._parser(responses).update_card_detail(
+            token=self._yoto_manager.token, card=detail
+        )
+        library[card_id].chapters = detail.chapters or {}
+
+    async def async_set_player_config(
+        self, player_id: str, config: YotoPlayerConfig
+    ) -> None:
+        """Write config changes for a player and refresh player status."""
+        payload: dict[str, Any] = {}
+        if config.day_mode_time:
+            payload["dayTime"] = config.day_mode_time.strftime("%H:%M")
+        if config.day_display_brightness is not None:
+            payload["dayDisplayBrightness"] = str(config.day_display_brightness)
+        if config.day_ambient_colour:
+            payload["ambientColour"] = config.day_ambient_colour
+        if config.day_max_volume_limit is not None:
+            payload["maxVolumeLimit"] = str(config.day_max_volume_limit)
+        if config.night_mode_time:
+            payload["nightTime"] = config.night_mode_time.strftime("%H:%M")
+        if config.night_display_brightness is not None:
+            payload["nightDisplayBrightness"] = str(config.night_display_brightness)
+        if config.night_ambient_colour:
+            payload["nightAmbientColour"] = config.night_ambient_colour
+        if config.night_max_volume_limit is not None:
+            payload["nightMaxVolumeLimit"] = str(config.night_max_volume_limit)
+        if config.alarms:
+            payload["alarms"] = [
+                f"{alarm.days_enabled},{alarm.time},{alarm.sound_id},,,"
+                f"{alarm.volume},{int(alarm.enabled)}"
+                for alarm in config.alarms
+            ]
+        data = {"deviceId": player_id, "config": payload}
+        response = await self._async_request(
+            "PUT", f"/device-v2/{player_id}/config", data
+        )
+        _LOGGER.debug(f"{DOMAIN} - Set Device Config Payload: {data}")
+        _LOGGER.debug(f"{DOMAIN} - Set Device Config Response: {response}")
+        await self.async_update_players_status()
@@ -0,0 +1,257 @@
+"""Artwork proxy for Yoto integration."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import io
+import logging
+import os
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from http import HTTPStatus
+from pathlib import Path
+
+from aiohttp import ClientError, ClientTimeout, web
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.components.http.auth import async_sign_path
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+from PIL import Image, UnidentifiedImageError
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_ARTWORK: HassKey[YotoArtworkCache] = HassKey(f"{DOMAIN}_artwork")
+
+# Requested sizes are rounded up to one of these so each image is stored in
+# at most a few variants.
+ARTWORK_SIZES = (128, 256, 512)
+ICON_SIZE = 128
+THUMBNAIL_SIZE = 256
+NOW_PLAYING_SIZE = 512
+CACHE_MAX_BYTES = 50 * 1024 * 1024
+FETCH_TIMEOUT = ClientTimeout(total=15)
+# Remote URLs, and signed paths, are remembered for this many image ids.
+URL_MEMORY = 4096
+SIGNED_PATH_LIFETIME = timedelta(days=1)
+
+CONTENT_TYPES = {".jpg": "image/jpeg", ".png": "image/png"}
+
+
+def _image_id(url: str) -> str:
+    return hashlib.sha256(url.encode()).hexdigest()[:32]
+
+
+def _snap_size(size: int) -> int:
+    return next(
+        (allowed for allowed in ARTWORK_SIZES if allowed >= size), ARTWORK_SIZES[-1]
+    )
+
+
+def _resize(data: bytes, size: int) -> tuple[bytes, str]:
+    """Shrink an image to fit size x size. Returns the bytes and file suffix."""
+    with Image.open(io.BytesIO(data)) as image:
+        image.thumbnail((size, size))
+        output = io.BytesIO()
+        if image.mode in ("RGBA", "LA", "P"):
+            image.save(output, "PNG", optimize=True)
+            return output.getvalue(), ".png"
+        image.convert("RGB").save(output, "JPEG", quality=85, optimize=True)
+        return output.getvalue(), ".jpg"
+
+
+class YotoArtworkCache:
+    """Fetch, resize and keep Yoto artwork in a size-capped disk LRU.
+
+    Files are named after the image id and size. Recency is kept in memory
+    and mirrored to file modification times so it survives restarts.
+    """
+
+    def __init__(self, hass: HomeAssistant, directory: Path, max_bytes: int) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._files: OrderedDict[str, tuple[str, int]] = OrderedDict()
+        self._total_bytes = 0
+        self._urls: OrderedDict[str, str] = OrderedDict()
+        self._signed: OrderedDict[str, tuple[str, datetime]] = OrderedDict()
+        self._pending: dict[str, asyncio.Task[tuple[bytes | None, str | None]]] = {}
+
+    async def async_load(self) -> None:
+        """Index the files already on disk, oldest first."""
+        for name, size in await self._hass.async_add_executor_job(self._scan):
+            self._files[Path(name).stem] = (name, size)
+            self._total_bytes += size
+        _LOGGER.debug(
+            f"{DOMAIN} - Artwork cache holds {len(self._files)} images,"
+            f" {self._total_bytes} bytes"
+        )
+
+    def _scan(self) -> list[tuple[str, int]]:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        entries = [
+            (entry.name, entry.stat())
+            for entry in os.scandir(self._directory)
+            if entry.is_file()
+        ]
+        entries.sort(key=lambda entry: entry[1].st_mtime)
+        return [(name, stat.st_size) for name, stat in entries]
+
+    def url_for(self, url: str | None, size: int) -> str | None:
+        """Return the local proxy path for a remote artwork URL."""
+        if not url:
+            return None
+        image_id = _image_id(url)
+        self._remember(self._urls, image_id, url)
+        return f"{YotoArtworkView.url_prefix}/{_snap_size(size)}/{image_id}"
+
+    @callback
+    def async_signed_url_for(self, url: str | None, size: int) -> str | None:
+        """Return a proxy path that also loads without auth, e.g. in <img> tags.
+
+        A signed path is reused until half its lifetime has passed, so state
+        attributes holding it do not change on every update.
+        """
+        if (path := self.url_for(url, size)) is None:
+            return None
+        now = dt_util.utcnow()
+        signed = self._signed.get(path)
+        if signed is None or signed[1] - now < SIGNED_PATH_LIFETIME / 2:
+            signed = (
+                async_sign_path(
+                    self._hass, path, SIGNED_PATH_LIFETIME, use_content_user=True
+                ),
+                now + SIGNED_PATH_LIFETIME,
+            )
+        self._remember(self._signed, path, signed)
+        return signed[0]
+
+    @staticmethod
+    def _remember[T](memory: OrderedDict[str, T], key: str, value: T) -> None:
+        """Store a value as most recently used, dropping the oldest over the cap."""
+        memory[key] = value
+        memory.move_to_end(key)
+        if len(memory) > URL_MEMORY:
+            memory.popitem(last=False)
+
+    async def async_get(self, url: str, size: int) -> tuple[bytes | None, str | None]:
+        """Return resized artwork for a remote URL."""
+        image_id = _image_id(url)
+        self._remember(self._urls, image_id, url)
+        return await self.async_get_by_id(image_id, size)
+
+    async def async_get_by_id(
+        self, image_id: str, size: int
+    ) -> tuple[bytes | None, str | None]:
+        """Return resized artwork by image id, fetching it on a cache miss."""
+        key = f"{image_id}_{_snap_size(size)}"
+        if key in self._files:
+            name, _ = self._files[key]
+            self._files.move_to_end(key)
+            if (
+                data := await self._hass.async_add_executor_job(self._read, name)
+            ) is not None:
+                return data, CONTENT_TYPES[Path(name).suffix]
+            self._forget(key)
+        if (url := self._urls.get(image_id)) is None:
+            return None, None
+        self._urls.move_to_end(image_id)
+        if (task := self._pending.get(key)) is None:
+            task = self._pending[key] = self._hass.async_create_task(
+                self._async_fetch(url, key, _snap_size(size)),
+                f"{DOMAIN} artwork fetch",
+                eager_start=False,
+            )
+            task.add_done_callback(lambda _: self._pending.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _async_fetch(
+        self, url: str, key: str, size: int
+    ) -> tuple[bytes | None, str | None]:
+        """Download, resize and store one artwork variant."""
+        session = async_get_clientsession(self._hass)
+        try:
+            async with session.get(url, timeout=FETCH_TIMEOUT) as response:
+                response.raise_for_status()
+                raw = await response.read()
+            data, suffix = await self._hass.async_add_executor_job(_resize, raw, size)
+        except (ClientError, TimeoutError, UnidentifiedImageError, OSError) as ex:
+            _LOGGER.debug(f"{DOMAIN} - Could not fetch artwork {url}: {ex}")
+            return None, None
+        name = key + suffix
+        evicted = []
+        self._files[key] = (name, len(data))
+        self._total_bytes += len(data)
+        while self._total_bytes > self._max_bytes and len(self._files) > 1:
+            old_key, (old_name, old_size) = self._files.popitem(last=False)
+            self._total_bytes -= old_size
+            evicted.append(old_name)
+        try:
+            await self._hass.async_add_executor_job(self._write, name, data, evicted)
+        except OSError as ex:
+            _LOGGER.warning(f"{DOMAIN} - Could not store artwork {name}: {ex}")
+            self._forget(key)
+        return data, CONTENT_TYPES[suffix]
+
+    def _forget(self, key: str) -> None:
+        _, size = self._files.pop(key)
+        self._total_bytes -= size
+
+    def _read(self, name: str) -> bytes | None:
+        path = self._directory / name
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return data
+
+    def _write(self, name: str, data: bytes, evicted: list[str]) -> None:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        (self._directory / name).write_bytes(data)
+        for old_name in evicted:
+            (self._directory / old_name).unlink(missing_ok=True)
+
+
+class YotoArtworkView(HomeAssistantView):
+    """Serve cached Yoto artwork.
+
+    The media browser fetches local thumbnails with the user's token, so the
+    usual auth applies; paths put in state attributes are signed instead.
+    Only image ids handed out by the integration, or already on disk, are
+    served, in the sizes url_for hands out.
+    """
+
+    requires_auth = True
+    url_prefix = f"/api/{DOMAIN}/artwork"
+    url = url_prefix + "/{size}/{image_id}"
+    name = f"api:{DOMAIN}:artwork"
+
+    async def get(self, request: web.Request, size: str, image_id: str) -> web.Response:
+        """Return an artwork image."""
+        if not size.isdigit() or int(size) not in ARTWORK_SIZES:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+        cache = request.app[KEY_HASS].data[DATA_ARTWORK]
+        data, content_type = await cache.async_get_by_id(image_id, int(size))
+        if data is None:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+        return web.Response(
+            body=data,
+            content_type=content_type,
+            headers={"Cache-Control": "max-age=86400"},
+        )
+
+
+async def async_setup_artwork(hass: HomeAssistant) -> None:
+    """Set up the artwork cache and register its view."""
+    cache = YotoArtworkCache(
+        hass, Path(hass.config.path(".cache", DOMAIN, "artwork")), CACHE_MAX_BYTES
+    )
+    await cache.async_load()
+    hass.data[DATA_ARTWORK] = cache
+    hass.http.register_view(YotoArtworkView)
@@ -0,0 +1,70 @@
+"""Access token management for Yoto integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .api import YotoApiClient
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Refresh ahead of expiry so a token never lapses mid-command.
+TOKEN_REFRESH_MARGIN = timedelta(hours=1)
+
+
+class YotoTokenManager:
+    """Keep the access token fresh with at most one refresh in flight."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: YotoApiClient,
+        on_refresh: CALLBACK_TYPE | None = None,
+    ) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._api = api
+        self._on_refresh = on_refresh
+        self._refresh_at: datetime | None = None
+        self._refresh_task: asyncio.Task | None = None
+
+    @property
+    def needs_refresh(self) -> bool:
+        """Return True if there is no access token or it is about to expire."""
+        return self._refresh_at is None or dt_util.utcnow() >= self._refresh_at
+
+    async def async_ensure_valid(self) -> None:
+        """Return once the access token is valid, refreshing it if required.
+
+        Concurrent callers share a single refresh. The refresh is shielded so a
+        cancelled caller does not abort it for the others.
+        """
+        if not self.needs_refresh:
+            return
+        if self._refresh_task is None:
+            self._refresh_task = self._hass.async_create_task(
+                self._async_refresh(), eager_start=False
+            )
+        await asyncio.shield(self._refresh_task)
+
+    async def _async_refresh(self) -> None:
+        """Refresh the token and notify the owner.
+
+        The owner is told once the new token is in place; anything slow it
+        does in response runs in its own task, so callers waiting for the
+        token are not held up.
+        """
+        try:
+            _LOGGER.debug(f"{DOMAIN} - access token expired, refreshing")
+            token = await self._api.async_refresh_token()
+            self._refresh_at = token.valid_until - TOKEN_REFRESH_MARGIN
+            if self._on_refresh is not None:
+                self._on_refresh()
+        finally:
+            self._refresh_task = None
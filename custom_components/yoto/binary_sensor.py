@@ -5,21 +5,22 @@ from __future__ import annotations
 import logging
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Final
+from functools import partial
+from typing import Any, Final
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
-from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory, Platform
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from yoto_api import YotoPlayer
 
-from .const import DOMAIN
 from .coordinator import YotoConfigEntry, YotoDataUpdateCoordinator
-from .entity import YotoEntity
+from .entity import YotoEntity, async_disabled_unique_ids, entity_unique_id
+from .player_snapshot import PlayerSnapshot
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,7 +29,7 @@ _LOGGER = logging.getLogger(__name__)
 class YotoBinarySensorEntityDescription(BinarySensorEntityDescription):
     """A class that describes custom binary sensor entities."""
 
-    is_on: Callable[[YotoPlayer], bool] | None = None
+    is_on: Callable[[PlayerSnapshot], bool] | None = None
 
 
 SENSOR_DESCRIPTIONS: Final[tuple[YotoBinarySensorEntityDescription, ...]] = (
@@ -89,13 +90,20 @@ async def async_setup_entry(
 ) -> None:
     """Set up binary_sensor platform."""
     coordinator = config_entry.runtime_data
-    entities: list[YotoBinarySensor] = []
-    for player_id in coordinator.yoto_manager.players.keys():
-        player: YotoPlayer = coordinator.yoto_manager.players[player_id]
-        for description in SENSOR_DESCRIPTIONS:
-            if getattr(player, description.key, None) is not None:
-                entities.append(YotoBinarySensor(coordinator, description, player))
-    async_add_entities(entities)
+    disabled = async_disabled_unique_ids(hass, config_entry, Platform.BINARY_SENSOR)
+
+    @callback
+    def _async_add_player(player: YotoPlayer) -> None:
+        # Some states only arrive over MQTT, so wait for the player to report.
+        async_add_entities(
+            YotoBinarySensor(coordinator, description, player)
+            for description in SENSOR_DESCRIPTIONS
+            if entity_unique_id(player.id, description.key) not in disabled
+            and getattr(player, description.key, None) is not None
+        )
+
+    for player in coordinator.yoto_manager.players.values():
+        coordinator.async_on_player_ready(player.id, partial(_async_add_player, player))
 
 
 class YotoBinarySensor(BinarySensorEntity, YotoEntity):
@@ -110,14 +118,18 @@ class YotoBinarySensor(BinarySensorEntity, YotoEntity):
         """Initialize the sensor."""
         super().__init__(coordinator, player)
         self._description = description
-        self._attr_unique_id = f"{DOMAIN}_{player.id}_{self._description.key}"
+        self._attr_unique_id = entity_unique_id(player.id, self._description.key)
         self._attr_device_class = self._description.device_class
         self._attr_entity_category = self._description.entity_category
         self._attr_translation_key = self._description.translation_key
+        self._watched_fields = frozenset({self._description.key})
+
+    def _state_fingerprint(self) -> tuple[Any, ...]:
+        return (self.available, self.is_on)
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
         if self._description.is_on is not None:
-            return self._description.is_on(self.player)
+            return self._description.is_on(self.snapshot)
         return None
@@ -0,0 +1,301 @@
+"""Media browsing for Yoto integration."""
+
+from __future__ import annotations
+
+import copy
+import logging
+import unicodedata
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from homeassistant.components.media_player import BrowseMedia, MediaClass, MediaType
+from homeassistant.components.media_source import BrowseMediaSource
+from homeassistant.core import HomeAssistant
+from yoto_api.Card import Card, Chapter, Track
+
+from .artwork import DATA_ARTWORK, THUMBNAIL_SIZE
+from .const import DOMAIN
+from .utils import split_media_id
+
+_LOGGER = logging.getLogger(__name__)
+
+PLAYER = "player"
+SOURCE = "source"
+
+LIBRARY_TITLE = "Yoto Library"
+
+# Larger libraries are split into alphabetical buckets, and larger buckets
+# into pages, so no browse response lists more than PAGE_SIZE children.
+PAGE_SIZE = 50
+BUCKET_PREFIX = "letter:"
+OTHER_BUCKET = "#"
+
+
+def _player_node(media_id: str | None, **kwargs: Any) -> BrowseMedia:
+    return BrowseMedia(media_content_id=media_id or "Root", **kwargs)
+
+
+def _source_node(media_id: str | None, **kwargs: Any) -> BrowseMediaSource:
+    return BrowseMediaSource(domain=DOMAIN, identifier=media_id, **kwargs)
+
+
+NODE_FACTORIES: dict[str, Callable[..., BrowseMedia]] = {
+    PLAYER: _player_node,
+    SOURCE: _source_node,
+}
+
+
+def _bucket_for(title: str | None) -> str:
+    """Return the alphabetical bucket for a card title."""
+    first = unicodedata.normalize("NFKD", (title or "").lstrip()[:1])[:1].upper()
+    return first if first.isalpha() else OTHER_BUCKET
+
+
+def _title_sort_key(card: Card) -> str:
+    return (card.title or "").casefold()
+
+
+def _detached[NodeT: BrowseMedia](node: NodeT) -> NodeT:
+    """Return a copy of a cached node that callers may modify.
+
+    Content filters replace a returned node's children and count what they
+    dropped in not_shown. A copy with its own children list keeps that from
+    reaching the cache. Children themselves are not modified and are shared.
+    """
+    detached = copy.copy(node)
+    if node.children is not None:
+        detached.children = list(node.children)
+    return detached
+
+
+class YotoBrowseTree:
+    """Build and cache browse nodes for the media player and media source.
+
+    Nodes are built on first request and kept until the library listing or
+    the card they show changes. Cards expand into chapters, and chapters with
+    several tracks into tracks; a card's details are fetched the first time
+    it or one of its chapters is opened.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        library: dict[str, Card],
+        fetch_card_detail: Callable[[str], Awaitable[None]],
+    ) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._library = library
+        self._fetch_card_detail = fetch_card_detail
+        self._nodes: dict[tuple[str, str | None], BrowseMedia] = {}
+        self._card_nodes: dict[str, dict[tuple[str, str], BrowseMedia]] = {}
+        self._buckets: dict[str, list[str]] | None = None
+
+    def invalidate_library(self) -> None:
+        """Drop every cached node after the library listing changed."""
+        self._nodes.clear()
+        self._card_nodes.clear()
+        self._buckets = None
+
+    def invalidate_card(self, card_id: str) -> None:
+        """Drop the cached card and chapter nodes of a card."""
+        self._card_nodes.pop(card_id, None)
+
+    async def async_browse_player(self, media_id: str | None) -> BrowseMedia:
+        """Return a node for the media player browser."""
+        return _detached(await self._async_node(PLAYER, media_id))
+
+    async def async_browse_source(self, identifier: str | None) -> BrowseMediaSource:
+        """Return a node for the media source browser."""
+        return _detached(await self._async_node(SOURCE, identifier))
+
+    async def _async_node(self, flavor: str, media_id: str | None) -> BrowseMedia:
+        if media_id in (None, "library", "Root"):
+            if (node := self._nodes.get((flavor, None))) is None:
+                node = self._nodes[flavor, None] = self._build_library(flavor)
+            return node
+        if media_id.startswith(BUCKET_PREFIX):
+            if (node := self._nodes.get((flavor, media_id))) is None:
+                node = self._nodes[flavor, media_id] = self._build_bucket(
+                    flavor, media_id
+                )
+            return node
+        card_id, chapter_key, _, _ = split_media_id(media_id)
+        chapters = self._library[card_id].chapters
+        if not chapters or (chapter_key is not None and chapter_key not in chapters):
+            # Fetching invalidates any node cached for this card.
+            await self._fetch_card_detail(card_id)
+        nodes = self._card_nodes.setdefault(card_id, {})
+        key = (flavor, media_id)
+        if (node := nodes.get(key)) is None:
+            node = nodes[key] = (
+                self._build_card(flavor, card_id)
+                if chapter_key is None
+                else self._build_chapter(flavor, card_id, chapter_key)
+            )
+        return node
+
+    @property
+    def buckets(self) -> dict[str, list[str]]:
+        """Return card ids grouped by bucket and sorted by title."""
+        if self._buckets is None:
+            buckets: dict[str, list[str]] = {}
+            for card in sorted(self._library.values(), key=_title_sort_key):
+                buckets.setdefault(_bucket_for(card.title), []).append(card.id)
+            self._buckets = dict(sorted(buckets.items()))
+        return self._buckets
+
+    def _thumbnail(self, url: str | None) -> str | None:
+        """Return the local artwork proxy path for a thumbnail."""
+        return self._hass.data[DATA_ARTWORK].url_for(url, THUMBNAIL_SIZE)
+
+    def _card_child(self, flavor: str, card_id: str) -> BrowseMedia:
+        """Build the library listing entry for a card."""
+        card = self._library[card_id]
+        return NODE_FACTORIES[flavor](
+            card.id,
+            media_class=MediaClass.MUSIC,
+            media_content_type=MediaType.MUSIC,
+            title=card.title,
+            can_expand=True,
+            can_play=True,
+            thumbnail=self._thumbnail(card.cover_image_large),
+        )
+
+    def _directory(
+        self, flavor: str, media_id: str | None, title: str, children: list[BrowseMedia]
+    ) -> BrowseMedia:
+        """Build a directory node holding cards or further directories."""
+        return NODE_FACTORIES[flavor](
+            media_id,
+            media_class=MediaClass.DIRECTORY,
+            media_content_type=MediaType.MUSIC,
+            title=title,
+            can_expand=True,
+            can_play=False,
+            children=children,
+            children_media_class=(
+                children[0].media_class if children else MediaClass.MUSIC
+            ),
+        )
+
+    def _build_library(self, flavor: str) -> BrowseMedia:
+        """Build the library root, bucketed when there are many cards."""
+        buckets = self.buckets
+        card_ids = [card_id for ids in buckets.values() for card_id in ids]
+        if len(card_ids) <= PAGE_SIZE:
+            children = [self._card_child(flavor, card_id) for card_id in card_ids]
+        else:
+            children = [
+                self._directory(
+                    flavor, BUCKET_PREFIX + bucket, f"{bucket} ({len(ids)})", []
+                )
+                for bucket, ids in buckets.items()
+            ]
+        return self._directory(flavor, None, LIBRARY_TITLE, children)
+
+    def _build_bucket(self, flavor: str, media_id: str) -> BrowseMedia:
+        """Build a bucket, or one page of it, from a "letter:A[:page]" id."""
+        bucket, _, page = media_id.removeprefix(BUCKET_PREFIX).partition(":")
+        card_ids = self.buckets.get(bucket, [])
+        if page:
+            start = (int(page) - 1) * PAGE_SIZE
+            page_ids = card_ids[start : start + PAGE_SIZE]
+            title = f"{bucket} {start + 1}-{start + len(page_ids)}"
+            children = [self._card_child(flavor, card_id) for card_id in page_ids]
+        elif len(card_ids) <= PAGE_SIZE:
+            title = bucket
+            children = [self._card_child(flavor, card_id) for card_id in card_ids]
+        else:
+            title = bucket
+            children = [
+                self._directory(
+                    flavor,
+                    f"{media_id}:{number}",
+                    f"{bucket} {start + 1}-{min(start + PAGE_SIZE, len(card_ids))}",
+                    [],
+                )
+                for number, start in enumerate(
+                    range(0, len(card_ids), PAGE_SIZE), start=1
+                )
+            ]
+        return self._directory(flavor, media_id, title, children)
+
+    def item_node(self, flavor: str, media_id: str) -> BrowseMedia:
+        """Build a standalone node for a card, chapter or track media id."""
+        card_id, chapter_key, track_key, _ = split_media_id(media_id)
+        if chapter_key is None:
+            return self._card_child(flavor, card_id)
+        chapter = self._library[card_id].chapters[chapter_key]
+        if track_key is None:
+            return self._chapter_child(flavor, card_id, chapter)
+        return self._track_child(flavor, media_id, chapter.tracks[track_key])
+
+    def _chapter_child(
+        self, flavor: str, card_id: str, chapter: Chapter
+    ) -> BrowseMedia:
+        """Build the card listing entry for a chapter."""
+        return NODE_FACTORIES[flavor](
+            card_id + "+" + chapter.key,
+            media_class=MediaClass.MUSIC,
+            media_content_type=MediaType.MUSIC,
+            title=chapter.title,
+            can_expand=len(chapter.tracks or {}) > 1,
+            can_play=True,
+            thumbnail=self._thumbnail(chapter.icon),
+        )
+
+    def _track_child(self, flavor: str, media_id: str, track: Track) -> BrowseMedia:
+        """Build the chapter listing entry for a track."""
+        return NODE_FACTORIES[flavor](
+            media_id,
+            media_class=MediaClass.MUSIC,
+            media_content_type=MediaType.MUSIC,
+            title=track.title,
+            can_expand=False,
+            can_play=True,
+            thumbnail=self._thumbnail(track.icon),
+        )
+
+    def _build_card(self, flavor: str, card_id: str) -> BrowseMedia:
+        """Build a card node with one child per chapter."""
+        make_node = NODE_FACTORIES[flavor]
+        card = self._library[card_id]
+        children = [
+            self._chapter_child(flavor, card_id, chapter)
+            for chapter in card.chapters.values()
+        ]
+        _LOGGER.debug(f"{DOMAIN} - Built browse node for {card_id}")
+        return make_node(
+            card_id,
+            media_class=MediaClass.MUSIC,
+            media_content_type=MediaType.MUSIC,
+            title=card.title,
+            can_expand=True,
+            can_play=True,
+            children=children,
+            children_media_class=MediaClass.MUSIC,
+        )
+
+    def _build_chapter(
+        self, flavor: str, card_id: str, chapter_key: str
+    ) -> BrowseMedia:
+        """Build a chapter node with one child per track."""
+        card = self._library[card_id]
+        chapter = card.chapters[chapter_key]
+        chapter_id = card_id + "+" + chapter_key
+        children = [
+            self._track_child(flavor, chapter_id + "+" + track.key, track)
+            for track in (chapter.tracks or {}).values()
+        ]
+        return NODE_FACTORIES[flavor](
+            chapter_id,
+            media_class=MediaClass.MUSIC,
+            media_content_type=MediaType.MUSIC,
+            title=chapter.title,
+            can_expand=True,
+            can_play=True,
+            thumbnail=self._thumbnail(chapter.icon or card.cover_image_large),
+            children=children,
+            children_media_class=MediaClass.MUSIC,
+        )
@@ -0,0 +1,121 @@
+"""Card detail fetching for Yoto integration."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+from collections.abc import Awaitable, Callable
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+PRIORITY_USER = 0
+PRIORITY_BACKGROUND = 1
+
+
+class CardDetailFetcher:
+    """Fetch card details once per card with a cap on concurrent requests.
+
+    Requests for a card that is already queued or being fetched join the
+    existing fetch. User-facing requests are served ahead of background ones.
+    Workers belong to the config entry, so unloading it cancels them.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        fetch: Callable[[str], Awaitable[None]],
+        max_concurrent: int,
+    ) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._config_entry = config_entry
+        self._fetch = fetch
+        self._max_concurrent = max_concurrent
+        self._queue: list[tuple[int, int, str]] = []
+        self._counter = itertools.count()
+        self._pending: dict[str, asyncio.Future[None]] = {}
+        self._started: set[str] = set()
+        self._user_requested: set[str] = set()
+        self._workers = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of cards queued or being fetched."""
+        return len(self._pending)
+
+    @property
+    def user_in_flight(self) -> int:
+        """Return the number of user-facing fetches queued or running."""
+        return len(self._user_requested)
+
+    async def async_fetch(self, card_id: str, *, priority: bool = False) -> None:
+        """Fetch a card's details, joining any fetch already under way."""
+        await asyncio.shield(self._enqueue(card_id, priority))
+
+    @callback
+    def async_schedule(self, card_id: str) -> None:
+        """Queue a background fetch without waiting for it."""
+        future = self._enqueue(card_id, False)
+        # Errors are logged by the worker; mark them retrieved here.
+        future.add_done_callback(lambda fut: fut.cancelled() or fut.exception())
+
+    def _enqueue(self, card_id: str, priority: bool) -> asyncio.Future[None]:
+        future = self._pending.get(card_id)
+        if future is not None and (card_id in self._started or not priority):
+            return future
+        if future is None:
+            future = self._pending[card_id] = self._hass.loop.create_future()
+        if priority:
+            self._user_requested.add(card_id)
+        # A queued background fetch promoted by a user request is pushed again
+        # at the higher priority; the worker skips whichever entry comes second.
+        heapq.heappush(
+            self._queue,
+            (
+                PRIORITY_USER if priority else PRIORITY_BACKGROUND,
+                next(self._counter),
+                card_id,
+            ),
+        )
+        if self._workers < self._max_concurrent:
+            self._workers += 1
+            self._config_entry.async_create_background_task(
+                self._hass, self._async_worker(), f"{DOMAIN} card detail fetch"
+            )
+        return future
+
+    async def _async_worker(self) -> None:
+        """Fetch queued cards until the queue is empty."""
+        try:
+            while self._queue:
+                _, _, card_id = heapq.heappop(self._queue)
+                if card_id in self._started or card_id not in self._pending:
+                    continue
+                self._started.add(card_id)
+                future = self._pending[card_id]
+                try:
+                    await self._fetch(card_id)
+                except asyncio.CancelledError:
+                    future.cancel()
+                    raise
+                except Exception as ex:
+                    _LOGGER.warning(
+                        f"{DOMAIN} - Failed to fetch details for card {card_id}: {ex}"
+                    )
+                    future.set_exception(ex)
+                else:
+                    future.set_result(None)
+                finally:
+                    self._started.discard(card_id)
+                    self._user_requested.discard(card_id)
+                    del self._pending[card_id]
+        finally:
+            self._workers -= 1
@@ -0,0 +1,90 @@
+"""Flattened chapter and track index for Yoto cards."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from yoto_api.Card import Card
+
+
+@dataclass(slots=True, eq=False)
+class TrackEntry:
+    """A track's place in its card and the fields shown while it plays."""
+
+    ordinal: int
+    chapter_key: str
+    track_key: str
+    media_content_id: str
+    chapter_icon: str | None
+    track_icon: str | None
+    previous: TrackEntry | None = None
+    next: TrackEntry | None = None
+
+
+@dataclass(slots=True)
+class CardEntry:
+    """A card's display fields and its tracks in play order."""
+
+    title: str | None
+    author: str | None
+    cover_image: str | None
+    tracks: dict[tuple[str, str], TrackEntry]
+
+    def track(
+        self, chapter_key: str | None, track_key: str | None
+    ) -> TrackEntry | None:
+        """Return the entry for a chapter and track key pair."""
+        return self.tracks.get((chapter_key, track_key))
+
+
+def _build_card_entry(card: Card) -> CardEntry:
+    """Flatten a card's chapters into play order and link neighbours."""
+    entries: list[TrackEntry] = []
+    for chapter in (card.chapters or {}).values():
+        for track in (chapter.tracks or {}).values():
+            entries.append(
+                TrackEntry(
+                    ordinal=len(entries),
+                    chapter_key=chapter.key,
+                    track_key=track.key,
+                    media_content_id=f"{card.id}+{chapter.key}+{track.key}",
+                    chapter_icon=chapter.icon,
+                    track_icon=track.icon,
+                )
+            )
+    for previous, entry in zip(entries, entries[1:], strict=False):
+        previous.next = entry
+        entry.previous = previous
+    return CardEntry(
+        title=card.title,
+        author=card.author,
+        cover_image=card.cover_image_large,
+        tracks={(entry.chapter_key, entry.track_key): entry for entry in entries},
+    )
+
+
+class YotoCardIndex:
+    """Per-card lookup tables for what a player is playing.
+
+    Entries are built on first use after a card's listing or details change,
+    so now-playing properties and track skips are single dictionary lookups.
+    """
+
+    def __init__(self, library: dict[str, Card]) -> None:
+        """Initialize."""
+        self._library = library
+        self._cards: dict[str, CardEntry] = {}
+
+    def get(self, card_id: str | None) -> CardEntry | None:
+        """Return the entry for a card in the library."""
+        if (entry := self._cards.get(card_id)) is None and card_id in self._library:
+            entry = self._cards[card_id] = _build_card_entry(self._library[card_id])
+        return entry
+
+    def library_updated(self) -> None:
+        """Drop all entries after the card listing changed."""
+        self._cards.clear()
+
+    def card_updated(self, card_id: str) -> None:
+        """Drop a card's entry after its details were fetched."""
+        self._cards.pop(card_id, None)
@@ -0,0 +1,93 @@
+"""Background card detail warm-up for Yoto integration."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+from aiohttp import ClientError
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from yoto_api import AuthenticationError
+from yoto_api.Card import Card
+
+from .card_fetcher import CardDetailFetcher
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CardDetailWarmer:
+    """Fetch missing card details ahead of use, one card per interval.
+
+    Cards are taken in the order given by ``ranking``, followed by the rest of
+    the library. A tick is skipped while a user-facing fetch is queued or
+    running, so warming never competes with someone waiting on the browser.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        fetcher: CardDetailFetcher,
+        library: dict[str, Card],
+        ranking: Callable[[], list[str]],
+        interval: timedelta,
+    ) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._fetcher = fetcher
+        self._library = library
+        self._ranking = ranking
+        self._interval = interval
+        self._queue: list[str] = []
+        self._running = False
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Start warming. Returns a callable that stops it."""
+        ranked = self._ranking()
+        ranked_set = set(ranked)
+        queue = ranked + [
+            card_id for card_id in self._library if card_id not in ranked_set
+        ]
+        # Popped from the end.
+        self._queue = [
+            card_id for card_id in reversed(queue) if self._needs_detail(card_id)
+        ]
+        _LOGGER.debug(f"{DOMAIN} - Warming details for {len(self._queue)} cards")
+        self._unsub = async_track_time_interval(
+            self._hass, self._async_tick, self._interval
+        )
+        return self.async_stop
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop warming."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    def _needs_detail(self, card_id: str) -> bool:
+        card = self._library.get(card_id)
+        return card is not None and not card.chapters
+
+    async def _async_tick(self, now: datetime) -> None:
+        """Fetch the next card that still has no details."""
+        if self._running or self._fetcher.user_in_flight:
+            return
+        while self._queue and not self._needs_detail(self._queue[-1]):
+            self._queue.pop()
+        if not self._queue:
+            _LOGGER.debug(f"{DOMAIN} - Card detail warm-up finished")
+            self.async_stop()
+            return
+        card_id = self._queue.pop()
+        self._running = True
+        try:
+            await self._fetcher.async_fetch(card_id)
+        except (AuthenticationError, ClientError, TimeoutError) as ex:
+            _LOGGER.debug(f"{DOMAIN} - Warming card {card_id} failed: {ex}")
+        finally:
+            self._running = False
@@ -0,0 +1,162 @@
+"""Command coalescing for Yoto integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+from homeassistant.helpers.event import async_call_later
+from yoto_api import YotoPlayerConfig
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class LatestWinsCommand[T]:
+    """Send only the newest value of a command while one is in flight.
+
+    Values submitted while a send is running replace each other, and only the
+    last one is sent when the player is free again. Every caller's awaitable
+    resolves once the value that superseded it has been sent.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, name: str, send: Callable[[T], Awaitable[None]]
+    ) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._name = name
+        self._send = send
+        self._pending: T | None = None
+        self._has_pending = False
+        self._waiters: list[asyncio.Future[None]] = []
+        self._runner: asyncio.Task | None = None
+        self.sent = 0
+        self.collapsed = 0
+
+    async def async_submit(self, value: T) -> None:
+        """Queue a value and wait until it, or a newer one, has been sent."""
+        if self._has_pending:
+            self.collapsed += 1
+            _LOGGER.debug(
+                f"{DOMAIN} - {self._name}: dropped {self._pending} for {value} "
+                f"({self.collapsed} collapsed, {self.sent} sent)"
+            )
+        self._pending = value
+        self._has_pending = True
+        waiter = self._hass.loop.create_future()
+        self._waiters.append(waiter)
+        if self._runner is None:
+            self._runner = self._hass.async_create_task(
+                self._async_run(), eager_start=False
+            )
+        await waiter
+
+    async def _async_run(self) -> None:
+        """Send pending values until none are left."""
+        try:
+            while self._has_pending:
+                value, waiters = self._pending, self._waiters
+                self._pending, self._has_pending, self._waiters = None, False, []
+                try:
+                    await self._send(value)
+                except Exception as ex:
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_exception(ex)
+                    continue
+                self.sent += 1
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_result(None)
+        finally:
+            self._runner = None
+
+
+@dataclass
+class _ConfigBatch:
+    """Config fields waiting to be written for one player."""
+
+    config: YotoPlayerConfig
+    done: asyncio.Future[None]
+    callers: int = 0
+    unsub: CALLBACK_TYPE | None = None
+
+
+class PlayerConfigBatcher:
+    """Merge config changes made within a short window into one write.
+
+    Callers set individual fields; all changes for the same player that arrive
+    before the window closes are sent in a single config write, and every
+    caller resolves when that write completes. Writes for the same player are
+    sent one after another, in the order their windows closed.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        write: Callable[[str, YotoPlayerConfig], Awaitable[None]],
+        delay: float,
+    ) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._write = write
+        self._delay = delay
+        self._batches: dict[str, _ConfigBatch] = {}
+        # Completion of the latest write started per player.
+        self._writes: dict[str, asyncio.Future[None]] = {}
+
+    async def async_set(self, player_id: str, **fields: Any) -> None:
+        """Stage config fields for a player and wait for the merged write."""
+        batch = self._batches.get(player_id)
+        if batch is None:
+            batch = self._batches[player_id] = _ConfigBatch(
+                YotoPlayerConfig(), self._hass.loop.create_future()
+            )
+            batch.unsub = async_call_later(
+                self._hass, self._delay, partial(self._async_flush, player_id)
+            )
+        for field, value in fields.items():
+            setattr(batch.config, field, value)
+        batch.callers += 1
+        await asyncio.shield(batch.done)
+
+    async def async_release(self) -> None:
+        """Write every staged batch now and wait for all writes to finish."""
+        for player_id, batch in list(self._batches.items()):
+            if batch.unsub is not None:
+                batch.unsub()
+            self._hass.async_create_task(
+                self._async_flush(player_id, None), eager_start=True
+            )
+        if self._writes:
+            await asyncio.wait(list(self._writes.values()))
+
+    async def _async_flush(self, player_id: str, _now: datetime | None) -> None:
+        """Write the merged config for a player after its previous write."""
+        batch = self._batches.pop(player_id)
+        previous = self._writes.get(player_id)
+        self._writes[player_id] = batch.done
+        if previous is not None and not previous.done():
+            # Its outcome belongs to its own callers.
+            await asyncio.wait((previous,))
+        _LOGGER.debug(
+            f"{DOMAIN} - Writing config for {player_id} merged from "
+            f"{batch.callers} changes"
+        )
+        try:
+            await self._write(player_id, batch.config)
+        except Exception as ex:
+            batch.done.set_exception(ex)
+        else:
+            batch.done.set_result(None)
+        finally:
+            if self._writes.get(player_id) is batch.done:
+                del self._writes[player_id]
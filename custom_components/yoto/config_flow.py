@@ -7,12 +7,38 @@ import logging
 from collections.abc import Mapping
 from typing import Any
 
+import voluptuous as vol
 from homeassistant import config_entries
-from homeassistant.config_entries import SOURCE_REAUTH, ConfigFlowResult
+from homeassistant.config_entries import (
+    SOURCE_REAUTH,
+    ConfigEntry,
+    ConfigFlowResult,
+    OptionsFlow,
+)
+from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
 from yoto_api import YotoManager
 
-from .const import CONF_TOKEN, DOMAIN
+from .const import (
+    CONF_AMBIENT_LIGHT_DEADBAND,
+    CONF_POLL_MAX_INTERVAL,
+    CONF_POLL_MIN_INTERVAL,
+    CONF_READY_TIMEOUT,
+    CONF_SENSOR_MIN_INTERVAL,
+    CONF_TEMPERATURE_DEADBAND,
+    CONF_TOKEN,
+    CONF_WARM_CARD_DETAILS,
+    CONF_WIFI_STRENGTH_DEADBAND,
+    DEFAULT_AMBIENT_LIGHT_DEADBAND,
+    DEFAULT_POLL_MAX_INTERVAL,
+    DEFAULT_POLL_MIN_INTERVAL,
+    DEFAULT_READY_TIMEOUT,
+    DEFAULT_SENSOR_MIN_INTERVAL,
+    DEFAULT_TEMPERATURE_DEADBAND,
+    DEFAULT_WARM_CARD_DETAILS,
+    DEFAULT_WIFI_STRENGTH_DEADBAND,
+    DOMAIN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,6 +51,12 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     token = None
     ym: YotoManager | None = None
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> YotoOptionsFlow:
+        """Get the options flow for this handler."""
+        return YotoOptionsFlow()
+
     async def async_step_reauth(
         self, entry_data: Mapping[str, Any]
     ) -> ConfigFlowResult:
@@ -130,5 +162,76 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return await self.async_step_user()
 
 
+class YotoOptionsFlow(OptionsFlow):
+    """Handle Yoto options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the polling options."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            if user_input[CONF_POLL_MIN_INTERVAL] > user_input[CONF_POLL_MAX_INTERVAL]:
+                errors["base"] = "poll_interval_order"
+            else:
+                return self.async_create_entry(data=user_input)
+
+        options = self.config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_POLL_MIN_INTERVAL,
+                        default=options.get(
+                            CONF_POLL_MIN_INTERVAL, DEFAULT_POLL_MIN_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=60)),
+                    vol.Required(
+                        CONF_POLL_MAX_INTERVAL,
+                        default=options.get(
+                            CONF_POLL_MAX_INTERVAL, DEFAULT_POLL_MAX_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=240)),
+                    vol.Required(
+                        CONF_READY_TIMEOUT,
+                        default=options.get(CONF_READY_TIMEOUT, DEFAULT_READY_TIMEOUT),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=120)),
+                    vol.Required(
+                        CONF_WARM_CARD_DETAILS,
+                        default=options.get(
+                            CONF_WARM_CARD_DETAILS, DEFAULT_WARM_CARD_DETAILS
+                        ),
+                    ): bool,
+                    vol.Required(
+                        CONF_SENSOR_MIN_INTERVAL,
+                        default=options.get(
+                            CONF_SENSOR_MIN_INTERVAL, DEFAULT_SENSOR_MIN_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                    vol.Required(
+                        CONF_AMBIENT_LIGHT_DEADBAND,
+                        default=options.get(
+                            CONF_AMBIENT_LIGHT_DEADBAND, DEFAULT_AMBIENT_LIGHT_DEADBAND
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=1000)),
+                    vol.Required(
+                        CONF_WIFI_STRENGTH_DEADBAND,
+                        default=options.get(
+                            CONF_WIFI_STRENGTH_DEADBAND, DEFAULT_WIFI_STRENGTH_DEADBAND
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=50)),
+                    vol.Required(
+                        CONF_TEMPERATURE_DEADBAND,
+                        default=options.get(
+                            CONF_TEMPERATURE_DEADBAND, DEFAULT_TEMPERATURE_DEADBAND
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=20)),
+                }
+            ),
+            errors=errors,
+        )
+
+
 class InvalidAuth(HomeAssistantError):
     """Error to indicate there is invalid auth."""
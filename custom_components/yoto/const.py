@@ -4,10 +4,58 @@ from datetime import timedelta
 
 DOMAIN: str = "yoto"
 
-# MQTT delivers real-time updates while a player is online but never pushes a
-# disconnect event, so polling is what surfaces the online -> offline transition.
+# Full refresh of player status and config. It picks up config changed in the
+# Yoto app and readings only the REST status carries (wifi strength,
+# temperature, light, charging, ...). MQTT delivers real-time updates while a
+# player is online but never pushes a disconnect event; that transition is
+# caught sooner by per-player checks once a player's MQTT traffic goes quiet.
 SCAN_INTERVAL = timedelta(minutes=5)
 
+# A player with no MQTT traffic for this long gets a targeted status check.
+QUIET_PLAYER_AFTER = timedelta(minutes=2)
+
+# Checks for a player that stays silent back off between these intervals.
+CONF_POLL_MIN_INTERVAL = "poll_min_interval"
+CONF_POLL_MAX_INTERVAL = "poll_max_interval"
+DEFAULT_POLL_MIN_INTERVAL = 1  # minutes
+DEFAULT_POLL_MAX_INTERVAL = 15  # minutes
+
+# Entities whose presence depends on MQTT data are added once their player
+# first reports, or after this many seconds if it does not.
+CONF_READY_TIMEOUT = "ready_timeout"
+DEFAULT_READY_TIMEOUT = 10
+
+# Config changes made within this many seconds of each other (e.g. a scene
+# setting night brightness, volume and colour) are sent as one write.
+CONFIG_WRITE_DELAY = 0.5
+
+# Upper bound on card detail requests running at the same time.
+CARD_DETAIL_MAX_FETCHES = 3
+
+# Optionally fetch missing card details in the background, one card per
+# interval, starting with recently and most played cards.
+CONF_WARM_CARD_DETAILS = "warm_card_details"
+DEFAULT_WARM_CARD_DETAILS = False
+CARD_WARM_INTERVAL = timedelta(seconds=10)
+
+# Reported playback positions within this many seconds of where the last
+# published position would have advanced to are not published again; the
+# frontend extrapolates from media_position_updated_at in between.
+MEDIA_POSITION_MAX_DRIFT = 3
+
+# Fluctuating telemetry sensors only write state when the reading moves by at
+# least their deadband, and at most once per minimum interval. Smaller drift
+# is still written once the maximum interval has passed since the last write.
+CONF_SENSOR_MIN_INTERVAL = "sensor_min_interval"
+DEFAULT_SENSOR_MIN_INTERVAL = 60  # seconds
+SENSOR_MAX_INTERVAL = timedelta(minutes=30)
+CONF_AMBIENT_LIGHT_DEADBAND = "ambient_light_deadband"
+DEFAULT_AMBIENT_LIGHT_DEADBAND = 5  # lux
+CONF_WIFI_STRENGTH_DEADBAND = "wifi_strength_deadband"
+DEFAULT_WIFI_STRENGTH_DEADBAND = 3  # dBm
+CONF_TEMPERATURE_DEADBAND = "temperature_deadband"
+DEFAULT_TEMPERATURE_DEADBAND = 1  # °C
+
 DYNAMIC_UNIT: str = "dynamic_unit"
 
 CONF_TOKEN = "token"
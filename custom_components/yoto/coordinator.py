@@ -2,19 +2,65 @@
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
 import logging
-from datetime import time
+from datetime import datetime, time, timedelta
+from typing import Any
 
+from aiohttp import ClientError
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-from yoto_api import AuthenticationError, YotoManager, YotoPlayerConfig
-
-from .const import CONF_TOKEN, DOMAIN, SCAN_INTERVAL
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from yoto_api import AuthenticationError, YotoManager, YotoPlayer, YotoPlayerConfig
+
+from .api import YotoApiClient, YotoEventsClient
+from .auth import YotoTokenManager
+from .browse import YotoBrowseTree
+from .card_fetcher import CardDetailFetcher
+from .card_index import YotoCardIndex
+from .card_warmer import CardDetailWarmer
+from .command_queue import PlayerConfigBatcher
+from .const import (
+    CARD_DETAIL_MAX_FETCHES,
+    CARD_WARM_INTERVAL,
+    CONF_POLL_MAX_INTERVAL,
+    CONF_POLL_MIN_INTERVAL,
+    CONF_READY_TIMEOUT,
+    CONF_TOKEN,
+    CONF_WARM_CARD_DETAILS,
+    CONFIG_WRITE_DELAY,
+    DEFAULT_POLL_MAX_INTERVAL,
+    DEFAULT_POLL_MIN_INTERVAL,
+    DEFAULT_READY_TIMEOUT,
+    DEFAULT_WARM_CARD_DETAILS,
+    DOMAIN,
+    QUIET_PLAYER_AFTER,
+    SCAN_INTERVAL,
+)
+from .library_index import DATA_LIBRARY_INDEX
+from .library_store import LibraryDelta, YotoLibraryStore
+from .player_snapshot import PlayerSnapshot
+from .poll_scheduler import YotoPollScheduler
+from .resolve_cache import YotoResolveCache
+from .search_index import YotoSearchIndex
 
 _LOGGER = logging.getLogger(__name__)
 
+# Pseudo field reported when card details for a player's card arrive.
+LIBRARY_FIELD = "library"
+
+
+@dataclasses.dataclass
+class StateWriteStats:
+    """Count entity state writes performed and skipped as unchanged."""
+
+    written: int = 0
+    skipped: int = 0
+
+
 type YotoConfigEntry = ConfigEntry["YotoDataUpdateCoordinator"]
 
 
@@ -25,12 +71,74 @@ class YotoDataUpdateCoordinator(DataUpdateCoordinator):
         """Initialize."""
         self.platforms: set[str] = set()
         self.config_entry = config_entry
+        # Options this setup was built with; other entry updates do not reload.
+        self.setup_options = dict(config_entry.options)
         self.yoto_manager = YotoManager(client_id="KFLTf5PCpTh0yOuDuyQ5C3LEU9PSbult")
         if config_entry.data.get(CONF_TOKEN):
             _LOGGER.debug("Using stored token")
             self.yoto_manager.set_refresh_token(config_entry.data.get(CONF_TOKEN))
         else:
             raise ConfigEntryAuthFailed("No token configured")
+        self.api = YotoApiClient(hass, self.yoto_manager)
+        self.token_manager = YotoTokenManager(
+            hass, self.api, on_refresh=self._async_token_refreshed
+        )
+        self.library_store = YotoLibraryStore(
+            hass, config_entry.entry_id, self.yoto_manager.library
+        )
+        self.browse_tree = YotoBrowseTree(
+            hass, self.yoto_manager.library, self.async_update_card_detail
+        )
+        self.search_index = YotoSearchIndex(self.yoto_manager.library)
+        self.resolve_cache = YotoResolveCache(self)
+        self.card_index = YotoCardIndex(self.yoto_manager.library)
+        self.card_fetcher = CardDetailFetcher(
+            hass, config_entry, self._async_fetch_card_detail, CARD_DETAIL_MAX_FETCHES
+        )
+        self.poll_scheduler = YotoPollScheduler(
+            hass,
+            self._async_refresh_status,
+            QUIET_PLAYER_AFTER,
+            timedelta(
+                minutes=config_entry.options.get(
+                    CONF_POLL_MIN_INTERVAL, DEFAULT_POLL_MIN_INTERVAL
+                )
+            ),
+            timedelta(
+                minutes=config_entry.options.get(
+                    CONF_POLL_MAX_INTERVAL, DEFAULT_POLL_MAX_INTERVAL
+                )
+            ),
+        )
+        self.card_warmer = (
+            CardDetailWarmer(
+                hass,
+                self.card_fetcher,
+                self.yoto_manager.library,
+                self.library_store.play_ranking,
+                CARD_WARM_INTERVAL,
+            )
+            if config_entry.options.get(
+                CONF_WARM_CARD_DETAILS, DEFAULT_WARM_CARD_DETAILS
+            )
+            else None
+        )
+        self._stop_poll_scheduler: CALLBACK_TYPE | None = None
+        self._library_sync: asyncio.Task[None] | None = None
+        self.last_library_delta: LibraryDelta | None = None
+        # Latest snapshot per player, replaced (never changed) on each update.
+        self.snapshots: dict[str, PlayerSnapshot] = {}
+        # Players heard from over MQTT.
+        self._reported_players: set[str] = set()
+        self.state_writes = StateWriteStats()
+        self._ready_players: set[str] = set()
+        self._ready_callbacks: dict[str, list[CALLBACK_TYPE]] = {}
+        self._player_listeners: dict[
+            str, dict[CALLBACK_TYPE, frozenset[str] | None]
+        ] = {}
+        self._config_batcher = PlayerConfigBatcher(
+            hass, self._async_write_player_config, CONFIG_WRITE_DELAY
+        )
         super().__init__(
             hass,
             _LOGGER,
@@ -58,35 +166,196 @@ class YotoDataUpdateCoordinator(DataUpdateCoordinator):
         except AuthenticationError as ex:
             _LOGGER.error(f"Authentication error: {ex}")
             raise ConfigEntryAuthFailed
+        except (ClientError, TimeoutError) as ex:
+            raise UpdateFailed(f"Error refreshing Yoto token: {ex}") from ex
 
-        await self.hass.async_add_executor_job(self.yoto_manager.update_players_status)
-        if len(self.yoto_manager.library.keys()) == 0:
-            await self.hass.async_add_executor_job(self.yoto_manager.update_library)
+        try:
+            await self.api.async_update_players_status()
+            # Every entity is updated after a refresh, so the changes need no
+            # notifying; this only moves the baseline for MQTT updates.
+            for player in self.yoto_manager.players.values():
+                self._player_changes(player)
+            if len(self.yoto_manager.library.keys()) == 0:
+                if await self.library_store.async_load():
+                    self._library_changed()
+                    self._async_start_library_sync()
+                else:
+                    await self.async_update_library()
+            else:
+                self._async_start_library_sync()
+        except AuthenticationError as ex:
+            _LOGGER.error(f"Authentication error: {ex}")
+            raise ConfigEntryAuthFailed from ex
+        except (ClientError, TimeoutError) as ex:
+            raise UpdateFailed(f"Error communicating with Yoto API: {ex}") from ex
         if self.yoto_manager.mqtt_client is None:
-            await self.hass.async_add_executor_job(
-                self.yoto_manager.connect_to_events, self.api_callback
+            # paho connects synchronously (DNS, TLS handshake), so this one-off
+            # setup stays in the executor.
+            await self.hass.async_add_executor_job(self._connect_events)
+        if self._stop_poll_scheduler is None:
+            self._stop_poll_scheduler = self.poll_scheduler.async_start(
+                list(self.yoto_manager.players)
+            )
+            if self.card_warmer is not None:
+                self.config_entry.async_on_unload(self.card_warmer.async_start())
+            # Players that never report (e.g. offline) are treated as ready
+            # once the timeout passes.
+            self.config_entry.async_on_unload(
+                async_call_later(
+                    self.hass,
+                    self.config_entry.options.get(
+                        CONF_READY_TIMEOUT, DEFAULT_READY_TIMEOUT
+                    ),
+                    self._async_ready_timeout,
+                )
             )
         return self.data
 
-    def api_callback(self) -> None:
-        """Handle API callback for media player updates."""
-        for player in self.yoto_manager.players.values():
-            if player.card_id and player.chapter_key:
-                if (
-                    player.card_id not in self.yoto_manager.library
-                    or not self.yoto_manager.library[player.card_id].chapters
-                ):
-                    self.hass.add_job(self.async_update_card_detail, player.card_id)
-                else:
-                    if (
-                        player.chapter_key
-                        not in self.yoto_manager.library[player.card_id].chapters
-                    ):
-                        self.hass.add_job(self.async_update_card_detail, player.card_id)
-        self.async_update_listeners()
+    @callback
+    def async_on_player_ready(
+        self, player_id: str, ready_callback: CALLBACK_TYPE
+    ) -> None:
+        """Call ready_callback once the player has sent its status over MQTT.
+
+        Called right away if it already has, or when the startup timeout
+        passes without a report.
+        """
+        if player_id in self._ready_players:
+            ready_callback()
+            return
+        self._ready_callbacks.setdefault(player_id, []).append(ready_callback)
+
+    @callback
+    def _async_player_ready(self, player_id: str) -> None:
+        """Mark a player as ready and run its pending callbacks."""
+        if player_id in self._ready_players:
+            return
+        self._ready_players.add(player_id)
+        for ready_callback in self._ready_callbacks.pop(player_id, []):
+            ready_callback()
+
+    @callback
+    def _async_ready_timeout(self, _now: datetime) -> None:
+        """Stop waiting for players that have not reported yet."""
+        if waiting := set(self.yoto_manager.players) - self._ready_players:
+            _LOGGER.debug(f"{DOMAIN} - No MQTT status yet from: {waiting}")
+        for player_id in waiting:
+            self._async_player_ready(player_id)
+
+    def _connect_events(self) -> None:
+        """Connect to MQTT, tagging each callback with the reporting player."""
+        self.yoto_manager.callback = self.api_callback
+        self.yoto_manager.mqtt_client = YotoEventsClient()
+        self.yoto_manager.mqtt_client.connect_mqtt(
+            self.yoto_manager.token, self.yoto_manager.players, self.api_callback
+        )
+
+    async def _async_refresh_status(self, player_ids: list[str]) -> None:
+        """Refresh the status of players that stopped reporting over MQTT."""
+        try:
+            await self.async_check_and_refresh_token()
+            await self.api.async_update_status(player_ids)
+        except (AuthenticationError, ClientError, TimeoutError) as ex:
+            _LOGGER.debug(f"{DOMAIN} - Player status refresh failed: {ex}")
+            # Players that did refresh are still reported below.
+        for player_id in player_ids:
+            if changed := self._player_changes(self.yoto_manager.players[player_id]):
+                self._async_notify_player(player_id, changed)
+
+    def api_callback(
+        self, player_id: str | None = None, topic: str | None = None
+    ) -> None:
+        """Handle API callback for media player updates.
+
+        Called from the MQTT thread after a message on topic (status or
+        events) for player_id was parsed. The update is handled on the event
+        loop, so snapshots are only ever taken there.
+        """
+        self.hass.loop.call_soon_threadsafe(
+            self._async_handle_player_update, player_id, topic
+        )
+
+    @callback
+    def _async_handle_player_update(
+        self, player_id: str | None, topic: str | None
+    ) -> None:
+        """Snapshot players after an MQTT message and notify their listeners."""
+        if player_id is None:
+            for player in self.yoto_manager.players.values():
+                self._player_changes(player)
+                self._async_check_card_detail(self.snapshots[player.id])
+            self.async_update_listeners()
+            return
+        self.poll_scheduler.activity(player_id)
+        # Only status messages carry the readings some entities need.
+        if topic == "status":
+            self._async_player_ready(player_id)
+        seen = player_id in self._reported_players
+        self._reported_players.add(player_id)
+        changed = self._player_changes(self.yoto_manager.players[player_id])
+        snapshot = self.snapshots[player_id]
+        self._async_check_card_detail(snapshot)
+        if changed:
+            if seen and "card_id" in changed and snapshot.card_id:
+                self.library_store.card_played(snapshot.card_id)
+            self._async_notify_player(player_id, changed)
+
+    @callback
+    def _async_check_card_detail(self, snapshot: PlayerSnapshot) -> None:
+        """Fetch details of the playing card if its chapter is not known yet."""
+        if not snapshot.card_id or not snapshot.chapter_key:
+            return
+        card = self.yoto_manager.library.get(snapshot.card_id)
+        if (
+            card is None
+            or not card.chapters
+            or snapshot.chapter_key not in card.chapters
+        ):
+            self.card_fetcher.async_schedule(snapshot.card_id)
+
+    def _player_changes(self, player: YotoPlayer) -> frozenset[str]:
+        """Snapshot a player. Return the fields changed since the last one."""
+        snapshot = PlayerSnapshot.from_player(player)
+        changed = snapshot.diff(self.snapshots.get(player.id))
+        self.snapshots[player.id] = snapshot
+        return changed
+
+    @callback
+    def async_add_player_listener(
+        self,
+        player_id: str,
+        update_callback: CALLBACK_TYPE,
+        fields: frozenset[str] | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for updates to one player.
+
+        The listener is only called when one of the given player fields
+        changes, or on every update of that player if fields is None.
+        """
+        listeners = self._player_listeners.setdefault(player_id, {})
+        listeners[update_callback] = fields
+
+        @callback
+        def remove_listener() -> None:
+            listeners.pop(update_callback, None)
+
+        return remove_listener
+
+    @callback
+    def _async_notify_player(self, player_id: str, changed: frozenset[str]) -> None:
+        """Call the listeners of a player that watch any of the changed fields."""
+        for update_callback, fields in list(
+            self._player_listeners.get(player_id, {}).items()
+        ):
+            if fields is None or not fields.isdisjoint(changed):
+                update_callback()
 
     async def release(self) -> None:
         """Disconnect from API."""
+        if self._stop_poll_scheduler is not None:
+            self._stop_poll_scheduler()
+            self._stop_poll_scheduler = None
+        await self._config_batcher.async_release()
         self.yoto_manager.disconnect()
 
     async def async_update_all(self) -> None:
@@ -94,74 +363,89 @@ class YotoDataUpdateCoordinator(DataUpdateCoordinator):
         await self.async_refresh()
 
     async def async_check_and_refresh_token(self) -> None:
-        """Refresh token if needed via library."""
-        await self.hass.async_add_executor_job(
-            self.yoto_manager.check_and_refresh_token
-        )
+        """Refresh the access token if it is missing or about to expire."""
+        await self.token_manager.async_ensure_valid()
+
+    @callback
+    def _async_token_refreshed(self) -> None:
+        """Handle a new access token."""
+        if self.yoto_manager.mqtt_client:
+            # The MQTT session authenticates with the access token.
+            self.config_entry.async_create_background_task(
+                self.hass, self._async_reconnect_events(), f"{DOMAIN} MQTT reconnect"
+            )
+
+    async def _async_reconnect_events(self) -> None:
+        """Reconnect to MQTT with the current access token."""
+        await self.hass.async_add_executor_job(self._reconnect_events)
+
+    def _reconnect_events(self) -> None:
+        """Reconnect MQTT with the current access token."""
+        self.yoto_manager.disconnect()
+        self._connect_events()
 
     async def async_pause_player(self, player_id: str) -> None:
         """Pause playback on the player."""
         await self.async_check_and_refresh_token()
-        await self.hass.async_add_executor_job(
-            self.yoto_manager.pause_player, player_id
-        )
+        self.yoto_manager.pause_player(player_id)
 
     async def async_resume_player(self, player_id: str) -> None:
         """Resume playback on the player."""
         await self.async_check_and_refresh_token()
-        await self.hass.async_add_executor_job(
-            self.yoto_manager.resume_player, player_id
-        )
+        self.yoto_manager.resume_player(player_id)
 
     async def async_stop_player(self, player_id: str) -> None:
         """Stop playback on the player."""
         await self.async_check_and_refresh_token()
-        await self.hass.async_add_executor_job(self.yoto_manager.stop_player, player_id)
+        self.yoto_manager.stop_player(player_id)
 
     async def async_set_time(self, player_id: str, key: str, value: time) -> None:
         """Set time for day/night mode."""
-        await self.async_check_and_refresh_token()
-        config = YotoPlayerConfig()
+        config: dict[str, Any] = {}
         if key == "day_mode_time":
-            config.day_mode_time = value
+            config["day_mode_time"] = value
         if key == "night_mode_time":
-            config.night_mode_time = value
-        await self.hass.async_add_executor_job(
-            self.yoto_manager.set_player_config, player_id, config
-        )
+            config["night_mode_time"] = value
+        await self._config_batcher.async_set(player_id, **config)
 
     async def async_set_max_volume(self, player_id: str, key: str, value: int) -> None:
         """Set maximum volume for day/night mode."""
-        await self.async_check_and_refresh_token()
-        config = YotoPlayerConfig()
+        config: dict[str, Any] = {}
         if key == "config.night_max_volume_limit":
-            config.night_max_volume_limit = int(value)
+            config["night_max_volume_limit"] = int(value)
         if key == "config.day_max_volume_limit":
-            config.day_max_volume_limit = int(value)
-        await self.hass.async_add_executor_job(
-            self.yoto_manager.set_player_config, player_id, config
-        )
+            config["day_max_volume_limit"] = int(value)
+        await self._config_batcher.async_set(player_id, **config)
 
     async def async_set_brightness(self, player_id: str, key: str, value: str) -> None:
         """Set display brightness for day/night mode."""
-        await self.async_check_and_refresh_token()
-        config = YotoPlayerConfig()
+        config: dict[str, Any] = {}
         if (
             key == "config.night_display_brightness"
             or key == "night_display_brightness"
         ):
             if value == "auto":
-                config.night_display_brightness = value
+                config["night_display_brightness"] = value
             else:
-                config.night_display_brightness = int(value)
+                config["night_display_brightness"] = int(value)
         if key == "config.day_display_brightness" or key == "day_display_brightness":
             if value == "auto":
-                config.day_display_brightness = value
+                config["day_display_brightness"] = value
             else:
-                config.day_display_brightness = int(value)
-        await self.hass.async_add_executor_job(
-            self.yoto_manager.set_player_config, player_id, config
-        )
+                config["day_display_brightness"] = int(value)
+        await self._config_batcher.async_set(player_id, **config)
+
+    async def _async_write_player_config(
+        self, player_id: str, config: YotoPlayerConfig
+    ) -> None:
+        """Send a merged config write for a player."""
+        await self.async_check_and_refresh_token()
+        await self.api.async_set_player_config(player_id, config)
+        # The write refreshes every player, so entities showing the written
+        # config, or another value derived from it, are updated.
+        for player in self.yoto_manager.players.values():
+            if changed := self._player_changes(player):
+                self._async_notify_player(player.id, changed)
 
     async def async_play_card(
         self,
@@ -174,83 +458,149 @@ class YotoDataUpdateCoordinator(DataUpdateCoordinator):
     ) -> None:
         """Play a card on the player."""
         await self.async_check_and_refresh_token()
-        await self.hass.async_add_executor_job(
-            self.yoto_manager.play_card,
-            player_id,
-            cardid,
-            secondsin,
-            cutoff,
-            chapter,
-            trackkey,
+        self.yoto_manager.play_card(
+            player_id, cardid, secondsin, cutoff, chapter, trackkey
         )
 
     async def async_seek(self, player_id: str, position: int) -> None:
         """Seek to a position in the current track."""
         await self.async_check_and_refresh_token()
-        await self.hass.async_add_executor_job(
-            self.yoto_manager.seek, player_id, position
-        )
+        self.yoto_manager.seek(player_id, position)
 
     async def async_next_track(self, player_id: str) -> None:
         """Skip to the next track."""
-        await self.async_check_and_refresh_token()
-        await self.hass.async_add_executor_job(self.yoto_manager.next_track, player_id)
+        await self._async_skip_track(player_id, forward=True)
 
     async def async_previous_track(self, player_id: str) -> None:
         """Skip to the previous track."""
+        await self._async_skip_track(player_id, forward=False)
+
+    async def _async_skip_track(self, player_id: str, forward: bool) -> None:
+        """Play the neighbouring track of the current card."""
         await self.async_check_and_refresh_token()
-        await self.hass.async_add_executor_job(
-            self.yoto_manager.previous_track, player_id
+        await self._async_ensure_current_card_detail(player_id)
+        player = self.yoto_manager.players[player_id]
+        if (card := self.card_index.get(player.card_id)) is None:
+            return
+        if (current := card.track(player.chapter_key, player.track_key)) is None:
+            return
+        if (target := current.next if forward else current.previous) is None:
+            return
+        self.yoto_manager.play_card(
+            player_id=player_id,
+            card=player.card_id,
+            chapterKey=target.chapter_key,
+            trackKey=target.track_key,
         )
 
+    async def _async_ensure_current_card_detail(self, player_id: str) -> None:
+        """Load chapters for the playing card so skips don't fetch inline."""
+        card_id = self.yoto_manager.players[player_id].card_id
+        if card_id is None:
+            return
+        card = self.yoto_manager.library.get(card_id)
+        if card is None or not card.chapters:
+            await self.async_update_card_detail(card_id)
+
     async def async_set_volume(self, player_id: str, volume: float) -> None:
         """Set player volume level."""
         volume = volume * 100
         volume = int(round(volume, 0))
         await self.async_check_and_refresh_token()
-        await self.hass.async_add_executor_job(
-            self.yoto_manager.set_volume, player_id, volume
-        )
+        self.yoto_manager.set_volume(player_id, volume)
 
     async def async_set_sleep_timer(self, player_id: str, time: int) -> None:
         """Set sleep timer on the player."""
         await self.async_check_and_refresh_token()
-        await self.hass.async_add_executor_job(
-            self.yoto_manager.set_sleep, player_id, int(time)
-        )
+        self.yoto_manager.set_sleep(player_id, int(time))
 
     async def async_set_light(self, player_id: str, key: str, color: str) -> None:
         """Set light color for day/night ambient mode."""
-        await self.async_check_and_refresh_token()
-        config = YotoPlayerConfig()
+        config: dict[str, Any] = {}
         if key == "config.day_ambient_colour":
-            config.day_ambient_colour = color
+            config["day_ambient_colour"] = color
         elif key == "config.night_ambient_colour":
-            config.night_ambient_colour = color
-        await self.hass.async_add_executor_job(
-            self.yoto_manager.set_player_config, player_id, config
-        )
+            config["night_ambient_colour"] = color
+        await self._config_batcher.async_set(player_id, **config)
 
     async def async_enable_disable_alarm(
         self, player_id: str, alarm: int, enable: bool
     ) -> None:
         """Enable or disable an alarm."""
-        await self.async_check_and_refresh_token()
-        config = YotoPlayerConfig()
-        config.alarms = self.yoto_manager.players[player_id].config.alarms
-        config.alarms[alarm].enabled = enable
-        await self.hass.async_add_executor_job(
-            self.yoto_manager.set_player_config, player_id, config
-        )
+        alarms = self.yoto_manager.players[player_id].config.alarms
+        alarms[alarm].enabled = enable
+        await self._config_batcher.async_set(player_id, alarms=alarms)
 
     async def async_update_card_detail(self, cardId: str) -> None:
+        """Get chapter and titles for the card ahead of background fetches."""
+        await self.card_fetcher.async_fetch(cardId, priority=True)
+
+    async def _async_fetch_card_detail(self, cardId: str) -> None:
         """Get chapter and titles for the card"""
         _LOGGER.debug(f"{DOMAIN} - Updating Card details for:  {cardId}")
-        await self.hass.async_add_executor_job(
-            self.yoto_manager.update_card_detail, cardId
-        )
+        await self.async_check_and_refresh_token()
+        await self.api.async_update_card_detail(cardId)
+        self.library_store.card_detail_updated(cardId)
+        self._card_detail_changed(cardId)
+        for player in self.yoto_manager.players.values():
+            if player.card_id == cardId:
+                self._async_notify_player(player.id, frozenset({LIBRARY_FIELD}))
+
+    async def async_update_library(self) -> LibraryDelta:
+        """Update library details.
 
-    async def async_update_library(self) -> None:
-        """Update library details."""
+        Returns the cards added, changed or removed since the last listing.
+        """
         _LOGGER.debug(f"{DOMAIN} - Updating library details")
-        await self.hass.async_add_executor_job(self.yoto_manager.update_library)
+        versions = await self.api.async_update_library()
+        delta = self.library_store.library_updated(versions)
+        for card_id in delta.removed:
+            self.resolve_cache.invalidate_card(card_id)
+        self._library_changed()
+        self.last_library_delta = delta
+        _LOGGER.debug(
+            f"{DOMAIN} - Library listing: {len(delta.added)} added,"
+            f" {len(delta.changed)} changed, {len(delta.removed)} removed"
+        )
+        return delta
+
+    def _library_changed(self) -> None:
+        """Update library views after the card listing changed."""
+        self.browse_tree.invalidate_library()
+        self.search_index.library_updated()
+        self.card_index.library_updated()
+        self.hass.data[DATA_LIBRARY_INDEX].library_updated(self)
+
+    def _card_detail_changed(self, card_id: str) -> None:
+        """Update library views after a card's details were fetched."""
+        self.browse_tree.invalidate_card(card_id)
+        self.search_index.card_updated(card_id)
+        self.resolve_cache.invalidate_card(card_id)
+        self.card_index.card_updated(card_id)
+        self.hass.data[DATA_LIBRARY_INDEX].card_detail_updated(self, card_id)
+
+    @callback
+    def _async_start_library_sync(self) -> None:
+        """Sync the library in the background unless a sync is running."""
+        if self._library_sync is not None and not self._library_sync.done():
+            return
+        self._library_sync = self.config_entry.async_create_background_task(
+            self.hass, self._async_sync_library(), f"{DOMAIN} library sync"
+        )
+
+    async def _async_sync_library(self) -> None:
+        """Apply library changes and fetch details of added or changed cards."""
+        try:
+            await self.async_check_and_refresh_token()
+            delta = await self.async_update_library()
+            await asyncio.gather(
+                *(self.card_fetcher.async_fetch(card_id) for card_id in delta.refetch)
+            )
+        except (AuthenticationError, ClientError, TimeoutError) as ex:
+            _LOGGER.warning(f"{DOMAIN} - Could not sync library: {ex}")
+            return
+        _LOGGER.debug(
+            f"{DOMAIN} - Synced library, refreshed {len(delta.refetch)} cards"
+        )
+        if delta or delta.refetch:
+            self.async_update_listeners()
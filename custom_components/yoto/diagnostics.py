@@ -0,0 +1,45 @@
+"""Diagnostics support for Yoto integration."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_TOKEN
+from .coordinator import YotoConfigEntry
+
+TO_REDACT = {CONF_TOKEN}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, config_entry: YotoConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = config_entry.runtime_data
+    return {
+        "entry": {
+            "data": async_redact_data(config_entry.data, TO_REDACT),
+            "options": dict(config_entry.options),
+        },
+        "players": list(coordinator.yoto_manager.players),
+        "player_snapshots": {
+            player_id: {
+                **snapshot._asdict(),
+                "config": snapshot.config and snapshot.config._asdict(),
+            }
+            for player_id, snapshot in coordinator.snapshots.items()
+        },
+        "library_cards": len(coordinator.yoto_manager.library),
+        "state_writes": asdict(coordinator.state_writes),
+        "last_library_sync": (
+            {
+                name: len(card_ids)
+                for name, card_ids in asdict(coordinator.last_library_delta).items()
+            }
+            if coordinator.last_library_delta is not None
+            else None
+        ),
+    }
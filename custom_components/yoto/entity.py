@@ -1,22 +1,70 @@
 """Base entity for Yoto integration."""
 
-from homeassistant.core import callback
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
+from .player_snapshot import PlayerSnapshot
+
+
+def entity_unique_id(player_id: str, key: str) -> str:
+    """Return the unique id of a player entity."""
+    return f"{DOMAIN}_{player_id}_{key}"
+
+
+@callback
+def async_disabled_unique_ids(
+    hass: HomeAssistant, config_entry: ConfigEntry, platform: Platform
+) -> frozenset[str]:
+    """Return the unique ids of a platform's entities disabled in the registry.
+
+    Platforms skip building these, so they cost neither setup time nor
+    listeners. Enabling one reloads the config entry, which builds it then.
+    Entities not registered yet are always built, so that disabled-by-default
+    ones get their registry entry.
+    """
+    registry = er.async_get(hass)
+    return frozenset(
+        entry.unique_id
+        for entry in er.async_entries_for_config_entry(registry, config_entry.entry_id)
+        if entry.domain == platform and entry.disabled
+    )
 
 
 class YotoEntity(CoordinatorEntity):
     """Base entity for Yoto integration."""
 
     _attr_has_entity_name = True
+    # Player fields this entity shows; MQTT updates touching none of them skip
+    # the entity. None means any change to the player.
+    _watched_fields: frozenset[str] | None = None
+    _last_fingerprint: tuple[Any, ...] | None = None
 
     def __init__(self, coordinator, player):
         """Initialize the base entity."""
         super().__init__(coordinator)
         self.player = player
 
+    async def async_added_to_hass(self) -> None:
+        """Register for updates to this entity's player."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_player_listener(
+                self.player.id, self._handle_coordinator_update, self._watched_fields
+            )
+        )
+
+    @property
+    def snapshot(self) -> PlayerSnapshot:
+        """Return the player's state as of its latest update."""
+        return self.coordinator.snapshots[self.player.id]
+
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information to use for this entity."""
@@ -28,9 +76,37 @@ class YotoEntity(CoordinatorEntity):
             sw_version=self.player.firmware_version,
         )
 
+    def _state_fingerprint(self) -> tuple[Any, ...]:
+        """Return what this entity would write to the state machine.
+
+        The default builds every attribute. Entities whose state follows from
+        a few values override this to return just those.
+        """
+        return (
+            self.available,
+            self.state,
+            self.state_attributes,
+            self.extra_state_attributes,
+        )
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state, remembering it for the unchanged-state check.
+
+        Writes made directly after a command go through here too, so a later
+        update restoring the previous state is not mistaken for no change.
+        """
+        self._last_fingerprint = self._state_fingerprint()
+        super().async_write_ha_state()
+
     @callback
     def _handle_coordinator_update(self) -> None:
-        # Coordinator's api_callback fires from the paho-mqtt thread, so route
-        # the state write through the thread-safe scheduler instead of the
-        # default async_write_ha_state.
-        self.schedule_update_ha_state()
+        # The coordinator hands MQTT updates over to the event loop, so the
+        # state can be written directly, but only if it actually changed.
+        fingerprint = self._state_fingerprint()
+        if fingerprint == self._last_fingerprint:
+            self.coordinator.state_writes.skipped += 1
+            return
+        self._last_fingerprint = fingerprint
+        self.coordinator.state_writes.written += 1
+        super().async_write_ha_state()
@@ -0,0 +1,114 @@
+"""Merged library of all Yoto accounts for the media source."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util.hass_dict import HassKey
+from yoto_api.Card import Card
+
+from .browse import YotoBrowseTree
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .coordinator import YotoDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_LIBRARY_INDEX: HassKey[YotoLibraryIndex] = HassKey(f"{DOMAIN}_library_index")
+
+
+class YotoLibraryIndex:
+    """Merge the libraries of every loaded account into one.
+
+    A card owned by several accounts is listed once and served by the first
+    loaded account that owns it; if that account unloads the next owner takes
+    over. Coordinators report their library and card detail changes, and only
+    the affected cards are updated.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self.library: dict[str, Card] = {}
+        self.browse_tree = YotoBrowseTree(hass, self.library, self._async_fetch_card)
+        self._owners: dict[str, list[YotoDataUpdateCoordinator]] = {}
+        self._card_ids: dict[YotoDataUpdateCoordinator, set[str]] = {}
+
+    @property
+    def loaded(self) -> bool:
+        """Return whether any account is loaded."""
+        return bool(self._card_ids)
+
+    def coordinator_for(self, card_id: str) -> YotoDataUpdateCoordinator | None:
+        """Return the coordinator that serves a card."""
+        owners = self._owners.get(card_id)
+        return owners[0] if owners else None
+
+    def add_coordinator(self, coordinator: YotoDataUpdateCoordinator) -> None:
+        """Start merging a coordinator's library."""
+        self._card_ids.setdefault(coordinator, set())
+        self.library_updated(coordinator)
+
+    def remove_coordinator(self, coordinator: YotoDataUpdateCoordinator) -> None:
+        """Stop merging a coordinator's library."""
+        if (card_ids := self._card_ids.pop(coordinator, None)) is None:
+            return
+        if self._remove_cards(coordinator, card_ids):
+            self.browse_tree.invalidate_library()
+
+    def library_updated(self, coordinator: YotoDataUpdateCoordinator) -> None:
+        """Apply cards added to or removed from a coordinator's library."""
+        if (known := self._card_ids.get(coordinator)) is None:
+            return
+        library = coordinator.yoto_manager.library
+        added = library.keys() - known
+        removed = known - library.keys()
+        changed = self._remove_cards(coordinator, removed)
+        for card_id in added:
+            owners = self._owners.setdefault(card_id, [])
+            owners.append(coordinator)
+            if len(owners) == 1:
+                self.library[card_id] = library[card_id]
+                changed = True
+        known |= added
+        known -= removed
+        # Listings update titles and covers in place, so the merged tree is
+        # stale whenever this account serves any card.
+        if changed or any(self._owners[card_id][0] is coordinator for card_id in known):
+            self.browse_tree.invalidate_library()
+        _LOGGER.debug(
+            f"{DOMAIN} - Merged library has {len(self.library)} cards"
+            f" (+{len(added)} -{len(removed)})"
+        )
+
+    def card_detail_updated(
+        self, coordinator: YotoDataUpdateCoordinator, card_id: str
+    ) -> None:
+        """Drop merged browse nodes of a card whose details were refetched."""
+        if self.coordinator_for(card_id) is coordinator:
+            self.browse_tree.invalidate_card(card_id)
+
+    def _remove_cards(
+        self, coordinator: YotoDataUpdateCoordinator, card_ids: set[str]
+    ) -> bool:
+        """Drop a coordinator's ownership of cards. Return True if any moved."""
+        changed = False
+        for card_id in card_ids:
+            owners = self._owners[card_id]
+            was_primary = owners[0] is coordinator
+            owners.remove(coordinator)
+            if not was_primary:
+                continue
+            changed = True
+            if owners:
+                self.library[card_id] = owners[0].yoto_manager.library[card_id]
+            else:
+                del self._owners[card_id]
+                del self.library[card_id]
+        return changed
+
+    async def _async_fetch_card(self, card_id: str) -> None:
+        """Fetch card details through the account that serves the card."""
+        await self._owners[card_id][0].async_update_card_detail(card_id)
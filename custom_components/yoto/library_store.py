@@ -0,0 +1,159 @@
+"""Persistent library cache for Yoto integration."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+from yoto_api.Card import Card, Chapter, Track
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+
+# Cards played most recently are warmed first, then the most played.
+RECENT_PLAYS = 10
+
+
+@dataclass
+class LibraryDelta:
+    """Cards added, changed or removed by a library listing.
+
+    ``refetch`` holds the cards whose details should be fetched: changed
+    cards that had details cached, and cards added since an earlier listing.
+    Cards seen in the very first listing are left for on-demand fetches.
+    """
+
+    added: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    refetch: list[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        """Return whether anything changed."""
+        return bool(self.added or self.changed or self.removed)
+
+
+def _card_from_dict(data: dict[str, Any]) -> Card:
+    """Rebuild a card, with chapters and tracks, from stored data."""
+    chapters = data.pop("chapters", None) or {}
+    card = Card(**data)
+    card.chapters = {}
+    for key, chapter_data in chapters.items():
+        tracks = chapter_data.pop("tracks", None)
+        chapter = Chapter(**chapter_data)
+        if tracks is not None:
+            chapter.tracks = {
+                track_key: Track(**track_data)
+                for track_key, track_data in tracks.items()
+            }
+        card.chapters[key] = chapter
+    return card
+
+
+class YotoLibraryStore:
+    """Keep the library and card details on disk between restarts.
+
+    Each card is stored with the content update marker reported by the library
+    listing, plus the marker its chapters were fetched at, so stale details can
+    be spotted when the listing is revalidated.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entry_id: str, library: dict[str, Card]
+    ) -> None:
+        """Initialize."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.library"
+        )
+        self._library = library
+        self._meta: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> bool:
+        """Load cached cards into the library. Return True if any were found."""
+        data = await self._store.async_load()
+        if not data:
+            return False
+        for card_id, entry in data["cards"].items():
+            self._library[card_id] = _card_from_dict(entry.pop("card"))
+            self._meta[card_id] = entry
+        _LOGGER.debug(f"{DOMAIN} - Loaded {len(self._library)} cards from cache")
+        return bool(self._library)
+
+    async def async_remove(self) -> None:
+        """Delete the cache file."""
+        await self._store.async_remove()
+
+    def library_updated(self, versions: dict[str, str | None]) -> LibraryDelta:
+        """Record a fresh library listing and drop cards no longer in it."""
+        now = dt_util.utcnow().isoformat()
+        known = {card_id for card_id, meta in self._meta.items() if "version" in meta}
+        delta = LibraryDelta(removed=sorted(known - versions.keys()))
+        for card_id in delta.removed:
+            del self._meta[card_id]
+            self._library.pop(card_id, None)
+        for card_id, version in versions.items():
+            meta = self._meta.setdefault(card_id, {})
+            if card_id not in known:
+                delta.added.append(card_id)
+                if known:
+                    delta.refetch.append(card_id)
+            elif meta["version"] != version:
+                delta.changed.append(card_id)
+            meta["version"] = version
+            meta["fetched_at"] = now
+            if (
+                self._library[card_id].chapters
+                and meta.get("detail_version") != version
+                and card_id not in delta.refetch
+            ):
+                # Also catches details cached before their card changed.
+                delta.refetch.append(card_id)
+        self._schedule_save()
+        return delta
+
+    def card_detail_updated(self, card_id: str) -> None:
+        """Record that a card's chapters were fetched."""
+        meta = self._meta.setdefault(card_id, {})
+        meta["detail_version"] = meta.get("version")
+        meta["detail_fetched_at"] = dt_util.utcnow().isoformat()
+        self._schedule_save()
+
+    def card_played(self, card_id: str) -> None:
+        """Record that a card was inserted into a player."""
+        meta = self._meta.setdefault(card_id, {})
+        meta["play_count"] = meta.get("play_count", 0) + 1
+        meta["last_played"] = dt_util.utcnow().isoformat()
+        self._schedule_save()
+
+    def play_ranking(self) -> list[str]:
+        """Return played cards, the most recent first, then by play count."""
+        played = [
+            card_id
+            for card_id, meta in self._meta.items()
+            if "last_played" in meta and card_id in self._library
+        ]
+        played.sort(
+            key=lambda card_id: self._meta[card_id]["last_played"], reverse=True
+        )
+        recent, rest = played[:RECENT_PLAYS], played[RECENT_PLAYS:]
+        rest.sort(key=lambda card_id: self._meta[card_id]["play_count"], reverse=True)
+        return recent + rest
+
+    def _schedule_save(self) -> None:
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {
+            "cards": {
+                card_id: {"card": asdict(card), **self._meta.get(card_id, {})}
+                for card_id, card in self._library.items()
+            }
+        }
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import logging
-from typing import Final
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Final
 
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
@@ -12,26 +14,47 @@ from homeassistant.components.light import (
     LightEntity,
     LightEntityDescription,
 )
-from homeassistant.const import EntityCategory
+from homeassistant.const import EntityCategory, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from yoto_api import YotoPlayer
 
 from .const import DOMAIN
 from .coordinator import YotoConfigEntry
-from .entity import YotoEntity
-from .utils import rgetattr
+from .entity import YotoEntity, async_disabled_unique_ids, entity_unique_id
+from .player_snapshot import PlayerSnapshot
 
 _LOGGER = logging.getLogger(__name__)
 
-SENSOR_DESCRIPTIONS: Final[tuple[LightEntityDescription, ...]] = (
-    LightEntityDescription(
+OFF_COLOUR = "#0"
+
+
+def _hex_to_rgb(value: str) -> tuple[int, int, int] | None:
+    """Parse a #rrggbb colour."""
+    hex_val = value.lstrip("#")
+    try:
+        return int(hex_val[0:2], 16), int(hex_val[2:4], 16), int(hex_val[4:6], 16)
+    except ValueError:
+        return None
+
+
+@dataclass(frozen=True, kw_only=True)
+class YotoLightEntityDescription(LightEntityDescription):
+    """Describe Yoto light entity."""
+
+    value_fn: Callable[[PlayerSnapshot], str | None]
+
+
+SENSOR_DESCRIPTIONS: Final[tuple[YotoLightEntityDescription, ...]] = (
+    YotoLightEntityDescription(
         key="config.day_ambient_colour",
+        value_fn=lambda snapshot: snapshot.config.day_ambient_colour,
         translation_key="day_ambient_colour",
         entity_category=EntityCategory.CONFIG,
     ),
-    LightEntityDescription(
+    YotoLightEntityDescription(
         key="config.night_ambient_colour",
+        value_fn=lambda snapshot: snapshot.config.night_ambient_colour,
         translation_key="night_ambient_colour",
         entity_category=EntityCategory.CONFIG,
     ),
@@ -45,11 +68,15 @@ async def async_setup_entry(
 ) -> None:
     """Set up sensor platform."""
     coordinator = config_entry.runtime_data
+    disabled = async_disabled_unique_ids(hass, config_entry, Platform.LIGHT)
     entities: list[YotoLight] = []
     for player_id in coordinator.yoto_manager.players.keys():
         player: YotoPlayer = coordinator.yoto_manager.players[player_id]
         for description in SENSOR_DESCRIPTIONS:
-            if rgetattr(player, description.key) is not None:
+            if (
+                entity_unique_id(player.id, description.key) not in disabled
+                and description.value_fn(coordinator.snapshots[player.id]) is not None
+            ):
                 entities.append(YotoLight(coordinator, description, player))
     async_add_entities(entities)
 
@@ -58,15 +85,19 @@ class YotoLight(LightEntity, YotoEntity):
     """Yoto sensor class."""
 
     def __init__(
-        self, coordinator, description: LightEntityDescription, player: YotoPlayer
+        self, coordinator, description: YotoLightEntityDescription, player: YotoPlayer
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, player)
         self._description = description
         self._key = self._description.key
-        self._attr_unique_id = f"{DOMAIN}_{player.id}_{self._key}"
+        self._attr_unique_id = entity_unique_id(player.id, self._key)
         self._attr_translation_key = self._description.translation_key
         self._attr_entity_category = description.entity_category
+        self._watched_fields = frozenset({self._key.split(".")[0]})
+        # Parsed colour, kept until the player reports a different value.
+        self._colour: str | None = None
+        self._rgb: tuple[int, int, int] | None = None
 
     @property
     def color_mode(self) -> ColorMode:
@@ -78,25 +109,26 @@ class YotoLight(LightEntity, YotoEntity):
         """Return the color modes the sensor supports."""
         return [ColorMode.RGB]
 
+    def _state_fingerprint(self) -> tuple[Any, ...]:
+        return (self.available, self.is_on, self.rgb_color)
+
     @property
-    def rgb_color(self) -> tuple[int, int, int]:
+    def rgb_color(self) -> tuple[int, int, int] | None:
         """Return the RGB color"""
-        hex_val = rgetattr(self.player, self._key).lstrip("#")
-        rgb_val = tuple(int(hex_val[i : i + 2], 16) for i in (0, 2, 4))
-        return rgb_val
+        colour = self._description.value_fn(self.snapshot)
+        if colour != self._colour:
+            self._colour = colour
+            self._rgb = _hex_to_rgb(colour) if colour else None
+        return self._rgb
 
     @property
     def is_on(self) -> bool:
         """Return if the light is on."""
-        status = rgetattr(self.player, self._key)
-        if status != "#0":
-            return True
-        else:
-            return False
+        return self._description.value_fn(self.snapshot) != OFF_COLOUR
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn device off."""
-        await self.coordinator.async_set_light(self.player.id, self._key, "#0")
+        await self.coordinator.async_set_light(self.player.id, self._key, OFF_COLOUR)
         self.async_write_ha_state()
 
     async def async_turn_on(self, **kwargs) -> None:
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
 from typing import Any
 
 from homeassistant.components.media_player import (
@@ -15,14 +14,22 @@ from homeassistant.components.media_player import (
     MediaPlayerEntityFeature,
     MediaPlayerState,
     MediaType,
+    SearchMedia,
+    SearchMediaQuery,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
 from yoto_api import YotoPlayer
 
-from .const import DOMAIN
-from .coordinator import YotoConfigEntry
-from .entity import YotoEntity
+from .artwork import DATA_ARTWORK, ICON_SIZE, NOW_PLAYING_SIZE
+from .browse import PAGE_SIZE, PLAYER
+from .card_index import CardEntry, TrackEntry
+from .command_queue import LatestWinsCommand
+from .const import DOMAIN, MEDIA_POSITION_MAX_DRIFT
+from .coordinator import LIBRARY_FIELD, YotoConfigEntry
+from .entity import YotoEntity, async_disabled_unique_ids, entity_unique_id
 from .utils import split_media_id
 
 _LOGGER = logging.getLogger(__name__)
@@ -35,10 +42,12 @@ async def async_setup_entry(
 ) -> None:
     """Set up Media Player platform."""
     coordinator = config_entry.runtime_data
+    disabled = async_disabled_unique_ids(hass, config_entry, Platform.MEDIA_PLAYER)
     entities: list[YotoMediaPlayer] = []
     for player_id in coordinator.yoto_manager.players.keys():
         player: YotoPlayer = coordinator.yoto_manager.players[player_id]
-        entities.append(YotoMediaPlayer(coordinator, player))
+        if entity_unique_id(player.id, "media_player") not in disabled:
+            entities.append(YotoMediaPlayer(coordinator, player))
     async_add_entities(entities)
 
 
@@ -46,7 +55,7 @@ class YotoMediaPlayer(MediaPlayerEntity, YotoEntity):
     """Yoto Media Player class."""
 
     _attr_has_entity_name = True
-    _attr_media_image_remotely_accessible = True
+    _attr_media_image_remotely_accessible = False
     _attr_name = None
     _attr_translation_key = "Yoto Media Player"
 
@@ -60,12 +69,82 @@ class YotoMediaPlayer(MediaPlayerEntity, YotoEntity):
         self._id = f"{player.name}"
         # self.data = data
         self._key = "media_player"
-        self._attr_unique_id = f"{DOMAIN}_{player.id}_media_player"
+        self._attr_unique_id = entity_unique_id(player.id, self._key)
         self._attr_name = None
         self._attr_device_class = MediaPlayerDeviceClass.SPEAKER
         self._currently_playing: dict | None = {}
         self._attr_volume_step = 0.0625
+        self._watched_fields = frozenset(
+            {
+                "online",
+                "playback_status",
+                "volume",
+                "card_id",
+                "chapter_key",
+                "chapter_title",
+                "track_key",
+                "track_title",
+                "track_length",
+                "track_position",
+                LIBRARY_FIELD,
+            }
+        )
         self._restricted_device: bool = False
+        # Slider drags and scrubbing fire many calls; only the newest matters.
+        self._volume_command = LatestWinsCommand[float](
+            coordinator.hass,
+            f"{player.id} volume",
+            lambda volume: coordinator.async_set_volume(player.id, volume),
+        )
+        self._seek_command = LatestWinsCommand[int](
+            coordinator.hass,
+            f"{player.id} seek",
+            lambda position: coordinator.async_seek(player.id, position),
+        )
+        # Track and playback status the published position was taken at.
+        self._position_context: tuple[str | None, ...] | None = None
+        self._update_position()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._update_position()
+        super()._handle_coordinator_update()
+
+    def _update_position(self) -> None:
+        """Publish the playback position only where it stops extrapolating.
+
+        That is on play/pause, a track change, or when the reported position
+        drifts from the extrapolated one, e.g. after a seek. Other position
+        reports leave the state unchanged, so they write nothing.
+        """
+        snapshot = self.snapshot
+        if snapshot.track_position is None:
+            self._attr_media_position = None
+            self._attr_media_position_updated_at = None
+            self._position_context = None
+            return
+        context = (
+            snapshot.card_id,
+            snapshot.chapter_key,
+            snapshot.track_key,
+            snapshot.playback_status,
+        )
+        updated_at = snapshot.last_updated_at or dt_util.utcnow()
+        if (
+            context == self._position_context
+            and self._attr_media_position is not None
+            and self._attr_media_position_updated_at is not None
+        ):
+            expected = self._attr_media_position
+            if snapshot.playback_status == "playing":
+                expected += (
+                    updated_at - self._attr_media_position_updated_at
+                ).total_seconds()
+            if abs(snapshot.track_position - expected) <= MEDIA_POSITION_MAX_DRIFT:
+                return
+        self._attr_media_position = snapshot.track_position
+        self._attr_media_position_updated_at = updated_at
+        self._position_context = context
 
     async def async_media_pause(self) -> None:
         """Pause playback."""
@@ -110,11 +189,11 @@ class YotoMediaPlayer(MediaPlayerEntity, YotoEntity):
 
     async def async_media_seek(self, position: float) -> None:
         """Send seek command."""
-        await self.coordinator.async_seek(self.player.id, int(position))
+        await self._seek_command.async_submit(int(position))
 
     async def async_set_volume_level(self, volume: float) -> None:
         """Set volume level."""
-        await self.coordinator.async_set_volume(self.player.id, volume)
+        await self._volume_command.async_submit(volume)
 
     async def async_browse_media(
         self,
@@ -126,104 +205,22 @@ class YotoMediaPlayer(MediaPlayerEntity, YotoEntity):
         _LOGGER.debug(
             f"{DOMAIN} - Browse Media id:  {media_content_id} content type: {media_content_type}"
         )
-        await self.coordinator.async_update_library()
-        if media_content_id in (None, "library"):
-            return await self.async_convert_library_to_browse_media()
-        else:
-            return await self.async_convert_chapter_to_browse_media(media_content_id)
-
-    async def async_convert_library_to_browse_media(self) -> BrowseMedia:
-        """Browse library content."""
-        children = []
-
-        for item in self.coordinator.yoto_manager.library.values():
-            children.append(
-                BrowseMedia(
-                    media_content_id=item.id,
-                    media_class=MediaClass.MUSIC,
-                    media_content_type=MediaType.MUSIC,
-                    title=item.title,
-                    can_expand=True,
-                    can_play=True,
-                    thumbnail=item.cover_image_large,
-                )
-            )
-        return BrowseMedia(
-            media_content_id="Root",
-            media_class=MediaClass.DIRECTORY,
-            media_content_type=MediaType.MUSIC,
-            title="Yoto Library",
-            can_expand=True,
-            can_play=False,
-            children=children,
-            children_media_class=MediaClass.MUSIC,
-        )
-
-    async def async_convert_chapter_to_browse_media(self, cardid: str) -> BrowseMedia:
-        """Browse chapter content for a card."""
-        children = []
-        _LOGGER.debug(
-            f"{DOMAIN} - Chapters:  {self.coordinator.yoto_manager.library[cardid].chapters}"
-        )
-        await self.coordinator.async_update_card_detail(cardid)
-        for item in self.coordinator.yoto_manager.library[cardid].chapters.values():
-            _LOGGER.debug(f"{DOMAIN} - Chapter processing:  {item}")
-            children.append(
-                BrowseMedia(
-                    media_content_id=cardid + "+" + item.key,
-                    media_class=MediaClass.MUSIC,
-                    media_content_type=MediaType.MUSIC,
-                    title=item.title,
-                    can_expand=False,
-                    can_play=True,
-                    thumbnail=item.icon,
-                )
-            )
-        _LOGGER.debug(f"{DOMAIN} - Browse media:  {children}")
-        return BrowseMedia(
-            media_content_id=cardid,
-            media_class=MediaClass.MUSIC,
-            media_content_type=MediaType.MUSIC,
-            title=self.coordinator.yoto_manager.library[cardid].title,
-            can_expand=False,
-            can_play=True,
-            children=children,
-            children_media_class=MediaClass.MUSIC,
-        )
-
-    async def async_convert_track_to_browse_media(
-        self, cardid: str, chapterid: str
-    ) -> BrowseMedia:
-        """Browse track content for a chapter."""
-        children = []
-        if self.coordinator.yoto_manager.library[cardid].chapters[chapterid].tracks:
-            for item in (
-                self.coordinator.yoto_manager.library[cardid]
-                .chapters[chapterid]
-                .tracks.values()
-            ):
-                children.append(
-                    BrowseMedia(
-                        media_content_id=cardid + "+" + chapterid + "+" + item.key,
-                        media_class=MediaClass.MUSIC,
-                        media_content_type=MediaType.MUSIC,
-                        title=item.title,
-                        can_expand=False,
-                        can_play=True,
-                        thumbnail=item.icon,
-                    )
+        return await self.coordinator.browse_tree.async_browse_player(media_content_id)
+
+    async def async_search_media(self, query: SearchMediaQuery) -> SearchMedia:
+        """Search cards, chapters and tracks already in the library."""
+        if query.media_filter_classes and (
+            MediaClass.MUSIC not in query.media_filter_classes
+        ):
+            return SearchMedia(result=[])
+        browse_tree = self.coordinator.browse_tree
+        return SearchMedia(
+            result=[
+                browse_tree.item_node(PLAYER, media_id)
+                for media_id in self.coordinator.search_index.search(
+                    query.search_query, PAGE_SIZE
                 )
-        return BrowseMedia(
-            media_content_id=cardid,
-            media_class=MediaClass.MUSIC,
-            media_content_type=MediaType.MUSIC,
-            title=self.coordinator.yoto_manager.library[cardid]
-            .chapters[chapterid]
-            .title,
-            can_expand=False,
-            can_play=True,
-            children=children,
-            children_media_class=MediaClass.MUSIC,
+            ]
         )
 
     @property
@@ -239,89 +236,92 @@ class YotoMediaPlayer(MediaPlayerEntity, YotoEntity):
             | MediaPlayerEntityFeature.PREVIOUS_TRACK
             | MediaPlayerEntityFeature.NEXT_TRACK
             | MediaPlayerEntityFeature.SEEK
+            | MediaPlayerEntityFeature.SEARCH_MEDIA
         )
 
     @property
     def state(self) -> MediaPlayerState:
         """Return the playback state."""
-
-        if self.player.playback_status == "paused":
+        snapshot = self.snapshot
+        if snapshot.playback_status == "paused":
             return MediaPlayerState.PAUSED
-        if self.player.playback_status == "playing":
+        if snapshot.playback_status == "playing":
             return MediaPlayerState.PLAYING
-        if self.player.playback_status == "stopped":
+        if snapshot.playback_status == "stopped":
             return MediaPlayerState.IDLE
-        if not self.player.online:
+        if not snapshot.online:
             return MediaPlayerState.OFF
-        if self.player.online:
+        if snapshot.online:
             return MediaPlayerState.ON
 
     @property
     def volume_level(self) -> float | None:
         """Return the volume level."""
-        if self.player.volume:
-            return self.player.volume / 16
+        if volume := self.snapshot.volume:
+            return volume / 16
         else:
             return None
 
     @property
     def media_duration(self) -> int | None:
         """Return the duration of the current media in seconds."""
-        return self.player.track_length
+        return self.snapshot.track_length
 
     @property
-    def media_position_updated_at(self) -> datetime | None:
-        """Return the last time the media position was updated."""
-        if self.player.track_position is None:
+    def _card_entry(self) -> CardEntry | None:
+        """Return the index entry of the current card."""
+        return self.coordinator.card_index.get(self.snapshot.card_id)
+
+    @property
+    def _track_entry(self) -> TrackEntry | None:
+        """Return the index entry of the current track."""
+        if (card := self._card_entry) is None:
             return None
-        return self.player.last_updated_at
+        return card.track(self.snapshot.chapter_key, self.snapshot.track_key)
 
     @property
     def media_artist(self) -> str | None:
         """Return the artist of the current media."""
-        if self.player.card_id in self.coordinator.yoto_manager.library:
-            return self.coordinator.yoto_manager.library[self.player.card_id].author
-        else:
+        if (card := self._card_entry) is None:
             return None
-
-    @property
-    def media_image_remotely_accessible(self) -> bool:
-        """If the image url is remotely accessible."""
-        return True
+        return card.author
 
     @property
     def media_album_name(self) -> str | None:
         """Return the album name of the current media."""
-        if self.player.card_id in self.coordinator.yoto_manager.library:
-            return self.coordinator.yoto_manager.library[self.player.card_id].title
-        else:
+        if (card := self._card_entry) is None:
             return None
+        return card.title
 
     @property
     def media_image_url(self) -> str | None:
         """Return the image URL of the current media."""
-        if self.player.card_id in self.coordinator.yoto_manager.library:
-            return self.coordinator.yoto_manager.library[
-                self.player.card_id
-            ].cover_image_large
-        else:
+        if (card := self._card_entry) is None:
             return None
+        return card.cover_image
 
     @property
-    def media_position(self) -> int | None:
-        """Return the current position of the playback."""
-        return self.player.track_position
+    def media_track(self) -> int | None:
+        """Return the position of the current track within the card."""
+        if (track := self._track_entry) is None:
+            return None
+        return track.ordinal + 1
+
+    async def async_get_media_image(self) -> tuple[bytes | None, str | None]:
+        """Return the current card's artwork, resized, from the local cache."""
+        if (url := self.media_image_url) is None:
+            return None, None
+        return await self.hass.data[DATA_ARTWORK].async_get(url, NOW_PLAYING_SIZE)
 
     @property
     def media_content_id(self) -> str | None:
         """Return the current media content ID."""
-        if self.player.card_id and self.player.chapter_key and self.player.track_key:
+        if (track := self._track_entry) is not None:
+            return track.media_content_id
+        snapshot = self.snapshot
+        if snapshot.card_id and snapshot.chapter_key and snapshot.track_key:
             return (
-                self.player.card_id
-                + "+"
-                + self.player.chapter_key
-                + "+"
-                + self.player.track_key
+                snapshot.card_id + "+" + snapshot.chapter_key + "+" + snapshot.track_key
             )
         else:
             return None
@@ -329,58 +329,26 @@ class YotoMediaPlayer(MediaPlayerEntity, YotoEntity):
     @property
     def media_title(self) -> str | None:
         """Return the current media title."""
-        if self.player.chapter_title == self.player.track_title:
-            return self.player.chapter_title
-        elif self.player.chapter_title and self.player.track_title:
-            return self.player.chapter_title + " - " + self.player.track_title
+        snapshot = self.snapshot
+        if snapshot.chapter_title == snapshot.track_title:
+            return snapshot.chapter_title
+        elif snapshot.chapter_title and snapshot.track_title:
+            return snapshot.chapter_title + " - " + snapshot.track_title
         else:
-            return self.player.chapter_title
+            return snapshot.chapter_title
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return device specific state attributes."""
         state_attributes: dict[str, Any] = {}
-        if self.player.card_id and self.player.chapter_key:
-            if (
-                self.player.card_id in self.coordinator.yoto_manager.library
-                and self.coordinator.yoto_manager.library[self.player.card_id].chapters
-            ):
-                if (
-                    self.player.chapter_key
-                    in self.coordinator.yoto_manager.library[
-                        self.player.card_id
-                    ].chapters
-                ):
-                    if (
-                        self.player.track_key
-                        in self.coordinator.yoto_manager.library[self.player.card_id]
-                        .chapters[self.player.chapter_key]
-                        .tracks
-                    ):
-                        if (
-                            self.coordinator.yoto_manager.library[self.player.card_id]
-                            .chapters[self.player.chapter_key]
-                            .icon
-                        ):
-                            state_attributes["media_chapter_icon"] = (
-                                self.coordinator.yoto_manager.library[
-                                    self.player.card_id
-                                ]
-                                .chapters[self.player.chapter_key]
-                                .icon
-                            )
-                        if (
-                            self.coordinator.yoto_manager.library[self.player.card_id]
-                            .chapters[self.player.chapter_key]
-                            .tracks[self.player.track_key]
-                            .icon
-                        ):
-                            state_attributes["media_track_icon"] = (
-                                self.coordinator.yoto_manager.library[
-                                    self.player.card_id
-                                ]
-                                .chapters[self.player.chapter_key]
-                                .tracks[self.player.track_key]
-                                .icon
-                            )
+        if (track := self._track_entry) is not None:
+            artwork = self.hass.data[DATA_ARTWORK]
+            if track.chapter_icon:
+                state_attributes["media_chapter_icon"] = artwork.async_signed_url_for(
+                    track.chapter_icon, ICON_SIZE
+                )
+            if track.track_icon:
+                state_attributes["media_track_icon"] = artwork.async_signed_url_for(
+                    track.track_icon, ICON_SIZE
+                )
         return state_attributes
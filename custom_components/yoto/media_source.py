@@ -2,24 +2,29 @@
 
 import logging
 
-from homeassistant.components.media_player import MediaClass, MediaType
+from homeassistant.components.media_player import BrowseError
 from homeassistant.components.media_source import (
     BrowseMediaSource,
     MediaSource,
     MediaSourceItem,
     PlayMedia,
+    Unresolvable,
 )
-from homeassistant.config_entries import ConfigEntryState
 from homeassistant.core import HomeAssistant
 
 from .const import DOMAIN
+from .library_index import DATA_LIBRARY_INDEX
 from .utils import split_media_id
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class YotoMediaSource(MediaSource):
-    """Provide media sources for Yoto Media Player."""
+    """Provide media sources for Yoto Media Player.
+
+    Browses the merged library of every loaded account and resolves each
+    card through the account that serves it.
+    """
 
     name: str = "Yoto Media"
 
@@ -27,156 +32,24 @@ class YotoMediaSource(MediaSource):
         """Initialize YotoMediaSource."""
         super().__init__(DOMAIN)
         self.hass = hass
-        self.coordinator = None
 
     async def async_resolve_media(self, item: MediaSourceItem) -> PlayMedia:
         """Provides the URL to play the media."""
-        cardid, chapterid, trackid, time = split_media_id(item.identifier)
-        if len(self.coordinator.yoto_manager.library[cardid].chapters.keys()) == 0:
-            await self.coordinator.async_update_card_detail(cardid)
-        if chapterid is None:
-            chapterid = next(
-                iter(self.coordinator.yoto_manager.library[cardid].chapters)
-            )
-        if trackid is None:
-            trackid = next(
-                iter(
-                    self.coordinator.yoto_manager.library[cardid]
-                    .chapters[chapterid]
-                    .tracks
-                )
-            )
-        track = (
-            self.coordinator.yoto_manager.library[cardid]
-            .chapters[chapterid]
-            .tracks[trackid]
-        )
-        if track.format == "aac":
-            mime = "audio/aac"
-        elif track.format == "mp3":
-            mime = "audio/mpeg"
-        elif track.format == "opus":
-            mime = "audio/opus"
-        else:
-            _LOGGER.error(
-                f"Unknown track format: {track.format}. Report this to the developer on GitHub."
-            )
-        return PlayMedia(track.trackUrl, mime)
+        card_id = split_media_id(item.identifier)[0]
+        coordinator = self.hass.data[DATA_LIBRARY_INDEX].coordinator_for(card_id)
+        if coordinator is None:
+            raise Unresolvable(f"Card {card_id} is not in any loaded Yoto library")
+        return await coordinator.resolve_cache.async_resolve(item.identifier)
 
     async def async_browse_media(
         self,
         item: MediaSourceItem | None,
     ) -> BrowseMediaSource:
         """Browse media for Yoto."""
-        if self.coordinator is None:
-            entries = [
-                entry
-                for entry in self.hass.config_entries.async_entries(DOMAIN)
-                if entry.state == ConfigEntryState.LOADED
-            ]
-            self.coordinator = entries[0].runtime_data
-        if item.identifier is None:
-            return await self.async_convert_library_to_browse_media()
-        else:
-            return await self.async_convert_chapter_to_browse_media(item.identifier)
-
-    async def async_convert_library_to_browse_media(self) -> BrowseMediaSource:
-        """Build media source for the library."""
-        children = []
-        for item in self.coordinator.yoto_manager.library.values():
-            children.append(
-                BrowseMediaSource(
-                    domain=DOMAIN,
-                    identifier=item.id,
-                    media_class=MediaClass.MUSIC,
-                    media_content_type=MediaType.MUSIC,
-                    title=item.title,
-                    can_play=True,
-                    can_expand=True,
-                    thumbnail=item.cover_image_large,
-                )
-            )
-        return BrowseMediaSource(
-            domain=DOMAIN,
-            identifier=None,
-            media_class=MediaClass.DIRECTORY,
-            media_content_type=MediaType.MUSIC,
-            title="Yoto Library",
-            can_play=False,
-            can_expand=True,
-            children=children,
-            children_media_class=MediaClass.MUSIC,
-        )
-
-    async def async_convert_chapter_to_browse_media(
-        self, cardid: str
-    ) -> BrowseMediaSource:
-        children = []
-
-        if len(self.coordinator.yoto_manager.library[cardid].chapters.keys()) == 0:
-            await self.coordinator.async_update_card_detail(cardid)
-        for item in self.coordinator.yoto_manager.library[cardid].chapters.values():
-            _LOGGER.debug(f"{DOMAIN} - Chapter processing:  {item}")
-            children.append(
-                BrowseMediaSource(
-                    domain=DOMAIN,
-                    identifier=cardid + "+" + item.key,
-                    media_class=MediaClass.MUSIC,
-                    media_content_type=MediaType.MUSIC,
-                    title=item.title,
-                    can_expand=False,
-                    can_play=True,
-                    thumbnail=item.icon,
-                )
-            )
-        return BrowseMediaSource(
-            domain=DOMAIN,
-            identifier=cardid,
-            media_class=MediaClass.MUSIC,
-            media_content_type=MediaType.MUSIC,
-            title=self.coordinator.yoto_manager.library[cardid].title,
-            can_expand=False,
-            can_play=True,
-            children=children,
-            children_media_class=MediaClass.MUSIC,
-        )
-
-    async def async_convert_track_to_browse_media(
-        self, cardid: str, chapterid: str
-    ) -> BrowseMediaSource:
-        """Build media source for tracks of a chapter."""
-        children = []
-        if self.coordinator.yoto_manager.library[cardid].chapters[chapterid].tracks:
-            for item in (
-                self.coordinator.yoto_manager.library[cardid]
-                .chapters[chapterid]
-                .tracks.values()
-            ):
-                children.append(
-                    BrowseMediaSource(
-                        domain=DOMAIN,
-                        identifier=cardid + "+" + chapterid + "+" + item.key,
-                        media_class=MediaClass.MUSIC,
-                        media_content_type=MediaType.MUSIC,
-                        title=item.title,
-                        can_expand=False,
-                        can_play=True,
-                        thumbnail=item.icon,
-                    )
-                )
-        return BrowseMediaSource(
-            domain=DOMAIN,
-            identifier=cardid,
-            media_class=MediaClass.MUSIC,
-            media_content_type=MediaType.MUSIC,
-            title=self.coordinator.yoto_manager.library[cardid]
-            .chapters[chapterid]
-            .title,
-            can_expand=False,
-            can_play=True,
-            children=children,
-            children_media_class=MediaClass.MUSIC,
-        )
+        library_index = self.hass.data[DATA_LIBRARY_INDEX]
+        if not library_index.loaded:
+            raise BrowseError("No Yoto account is loaded")
+        return await library_index.browse_tree.async_browse_source(item.identifier)
 
 
 async def async_get_media_source(hass: HomeAssistant) -> YotoMediaSource:
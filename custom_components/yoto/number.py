@@ -3,44 +3,63 @@
 from __future__ import annotations
 
 import logging
-from typing import Final
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Final
 
 from homeassistant.components.number import (
     NumberDeviceClass,
     NumberEntity,
     NumberEntityDescription,
 )
-from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfTime
+from homeassistant.const import PERCENTAGE, EntityCategory, Platform, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from yoto_api import YotoPlayer
 
-from .const import DOMAIN
 from .coordinator import YotoConfigEntry
-from .entity import YotoEntity
-from .utils import rgetattr
+from .entity import YotoEntity, async_disabled_unique_ids, entity_unique_id
+from .player_snapshot import PlayerSnapshot
 
 _LOGGER = logging.getLogger(__name__)
 
-SENSOR_DESCRIPTIONS: Final[tuple[NumberEntityDescription, ...]] = (
-    NumberEntityDescription(
+
+def _brightness(value: str | None) -> int | None:
+    """Convert a display brightness, where "auto" shows as full brightness."""
+    if value is None:
+        return None
+    return 100 if value == "auto" else int(value)
+
+
+@dataclass(frozen=True, kw_only=True)
+class YotoNumberEntityDescription(NumberEntityDescription):
+    """Describe Yoto number entity."""
+
+    value_fn: Callable[[PlayerSnapshot], float | None]
+
+
+SENSOR_DESCRIPTIONS: Final[tuple[YotoNumberEntityDescription, ...]] = (
+    YotoNumberEntityDescription(
         key="config.night_max_volume_limit",
+        value_fn=lambda snapshot: snapshot.config.night_max_volume_limit,
         translation_key="night_max_volume_limit",
         native_min_value=0,
         native_max_value=16,
         native_step=1,
         entity_category=EntityCategory.CONFIG,
     ),
-    NumberEntityDescription(
+    YotoNumberEntityDescription(
         key="config.day_max_volume_limit",
+        value_fn=lambda snapshot: snapshot.config.day_max_volume_limit,
         translation_key="day_max_volume_limit",
         native_min_value=0,
         native_max_value=16,
         native_step=1,
         entity_category=EntityCategory.CONFIG,
     ),
-    NumberEntityDescription(
+    YotoNumberEntityDescription(
         key="config.day_display_brightness",
+        value_fn=lambda snapshot: _brightness(snapshot.config.day_display_brightness),
         translation_key="day_display_brightness",
         native_min_value=0,
         native_max_value=100,
@@ -48,8 +67,9 @@ SENSOR_DESCRIPTIONS: Final[tuple[NumberEntityDescription, ...]] = (
         native_unit_of_measurement=PERCENTAGE,
         entity_category=EntityCategory.CONFIG,
     ),
-    NumberEntityDescription(
+    YotoNumberEntityDescription(
         key="config.night_display_brightness",
+        value_fn=lambda snapshot: _brightness(snapshot.config.night_display_brightness),
         translation_key="night_display_brightness",
         native_min_value=0,
         native_max_value=100,
@@ -57,8 +77,9 @@ SENSOR_DESCRIPTIONS: Final[tuple[NumberEntityDescription, ...]] = (
         native_unit_of_measurement=PERCENTAGE,
         entity_category=EntityCategory.CONFIG,
     ),
-    NumberEntityDescription(
+    YotoNumberEntityDescription(
         key="sleep_timer_seconds_remaining",
+        value_fn=lambda snapshot: snapshot.sleep_timer_seconds_remaining,
         translation_key="sleep_timer",
         device_class=NumberDeviceClass.DURATION,
         native_min_value=0,
@@ -77,11 +98,15 @@ async def async_setup_entry(
 ) -> None:
     """Set up sensor platform."""
     coordinator = config_entry.runtime_data
+    disabled = async_disabled_unique_ids(hass, config_entry, Platform.NUMBER)
     entities: list[YotoNumber] = []
     for player_id in coordinator.yoto_manager.players.keys():
         player: YotoPlayer = coordinator.yoto_manager.players[player_id]
         for description in SENSOR_DESCRIPTIONS:
-            if rgetattr(player, description.key) is not None:
+            if (
+                entity_unique_id(player.id, description.key) not in disabled
+                and description.value_fn(coordinator.snapshots[player.id]) is not None
+            ):
                 entities.append(YotoNumber(coordinator, description, player))
     async_add_entities(entities)
 
@@ -90,27 +115,25 @@ class YotoNumber(NumberEntity, YotoEntity):
     """Yoto sensor class."""
 
     def __init__(
-        self, coordinator, description: NumberEntityDescription, player: YotoPlayer
+        self, coordinator, description: YotoNumberEntityDescription, player: YotoPlayer
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, player)
         self._description = description
         self._key = self._description.key
-        self._attr_unique_id = f"{DOMAIN}_{player.id}_{self._key}"
+        self._attr_unique_id = entity_unique_id(player.id, self._key)
         self._attr_device_class = self._description.device_class
         self._attr_translation_key = self._description.translation_key
         self._attr_entity_category = description.entity_category
+        self._watched_fields = frozenset({self._key.split(".")[0]})
+
+    def _state_fingerprint(self) -> tuple[Any, ...]:
+        return (self.available, self.native_value)
 
     @property
     def native_value(self) -> float | None:
         """Return the entity value to represent the entity state."""
-        if (
-            self._key == "config.day_display_brightness"
-            or self._key == "config.night_display_brightness"
-        ) and rgetattr(self.player, self._key) == "auto":
-            return 100
-        else:
-            return rgetattr(self.player, self._key)
+        return self._description.value_fn(self.snapshot)
 
     @property
     def native_min_value(self) -> float:
@@ -0,0 +1,101 @@
+"""Immutable player state snapshots for Yoto integration."""
+
+from __future__ import annotations
+
+from datetime import datetime, time
+from operator import attrgetter
+from typing import NamedTuple
+
+from yoto_api import YotoPlayer, YotoPlayerConfig
+
+
+class ConfigSnapshot(NamedTuple):
+    """The player config fields the platforms show, copied at one update."""
+
+    day_mode_time: time | None
+    day_display_brightness: str | None
+    day_ambient_colour: str | None
+    day_max_volume_limit: int | None
+    night_mode_time: time | None
+    night_display_brightness: str | None
+    night_ambient_colour: str | None
+    night_max_volume_limit: int | None
+    alarms_enabled: tuple[bool, ...]
+
+    @classmethod
+    def from_config(cls, config: YotoPlayerConfig) -> ConfigSnapshot:
+        """Copy the fields from a player config."""
+        return cls(
+            *_read_config_fields(config),
+            alarms_enabled=tuple(alarm.enabled for alarm in config.alarms or ()),
+        )
+
+
+class PlayerSnapshot(NamedTuple):
+    """The player fields the platforms show, copied at one update.
+
+    YotoPlayer objects are changed in place by the MQTT thread. A snapshot
+    is taken after each update and never changes, so entities read one
+    consistent state and updates can be compared field by field. The config
+    is compared as a whole and reported as the config field.
+    """
+
+    online: bool | None
+    last_updated_at: datetime | None
+    battery_level_percentage: int | None
+    battery_temperature: int | None
+    temperature_celcius: int | None
+    ambient_light_sensor_reading: int | None
+    wifi_strength: int | None
+    day_mode_on: bool | None
+    night_light_mode: str | None
+    bluetooth_audio_connected: bool | None
+    audio_device_connected: bool | None
+    charging: bool | None
+    sleep_timer_active: bool | None
+    sleep_timer_seconds_remaining: int | None
+    playback_status: str | None
+    volume: int | None
+    card_id: str | None
+    chapter_key: str | None
+    chapter_title: str | None
+    track_key: str | None
+    track_title: str | None
+    track_length: int | None
+    track_position: int | None
+    config: ConfigSnapshot | None
+
+    @classmethod
+    def from_player(cls, player: YotoPlayer) -> PlayerSnapshot:
+        """Copy the fields from a player."""
+        return cls(
+            *_read_fields(player),
+            config=(
+                ConfigSnapshot.from_config(player.config)
+                if player.config is not None
+                else None
+            ),
+        )
+
+    def diff(self, previous: PlayerSnapshot | None) -> frozenset[str]:
+        """Return the fields that differ from an earlier snapshot.
+
+        Every field counts as changed when there is no earlier snapshot.
+        """
+        if previous is None:
+            return SNAPSHOT_FIELDS
+        if self == previous:
+            return frozenset()
+        return frozenset(
+            name
+            for name, old, new in zip(self._fields, previous, self, strict=True)
+            if old != new
+        )
+
+
+SNAPSHOT_FIELDS: frozenset[str] = frozenset(PlayerSnapshot._fields)
+
+# Read every field but the nested config, and every config field but the
+# alarms, in one call each.
+_read_fields = attrgetter(*PlayerSnapshot._fields[:-1])
+_read_config_fields = attrgetter(*ConfigSnapshot._fields[:-1])
@@ -0,0 +1,106 @@
+"""Per-player polling for Yoto integration."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+TICK_INTERVAL = timedelta(seconds=15)
+BACKOFF_FACTOR = 2
+
+
+@dataclass
+class _PlayerPollState:
+    """Polling state for one player."""
+
+    last_activity: datetime
+    interval: timedelta
+    next_check: datetime | None = None
+
+
+class YotoPollScheduler:
+    """Check on players only once their MQTT traffic goes quiet.
+
+    MQTT never reports a player going offline, so a player that has been
+    silent for ``quiet_after`` gets a targeted status check. Checks for a
+    player that stays silent back off from ``min_interval`` to
+    ``max_interval``; any MQTT message from it resets the backoff.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        check: Callable[[list[str]], Awaitable[None]],
+        quiet_after: timedelta,
+        min_interval: timedelta,
+        max_interval: timedelta,
+    ) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._check = check
+        self._quiet_after = quiet_after
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._players: dict[str, _PlayerPollState] = {}
+        self._checking = False
+
+    @callback
+    def async_start(self, player_ids: list[str]) -> CALLBACK_TYPE:
+        """Start tracking players. Returns a callable that stops the scheduler."""
+        for player_id in player_ids:
+            self.activity(player_id)
+        return async_track_time_interval(self._hass, self._async_tick, TICK_INTERVAL)
+
+    def activity(self, player_id: str) -> None:
+        """Record that a player just reported over MQTT."""
+        self._players[player_id] = _PlayerPollState(
+            last_activity=dt_util.utcnow(), interval=self._min_interval
+        )
+
+    def silent_players(self) -> list[str]:
+        """Return players that have not reported within the quiet period."""
+        cutoff = dt_util.utcnow() - self._quiet_after
+        return [
+            player_id
+            for player_id, state in self._players.items()
+            if state.last_activity <= cutoff
+        ]
+
+    async def _async_tick(self, now: datetime) -> None:
+        """Check silent players whose next check is due."""
+        if self._checking:
+            return
+        due = []
+        for player_id in self.silent_players():
+            state = self._players[player_id]
+            if state.next_check is None:
+                state.next_check = state.last_activity + self._quiet_after
+            if state.next_check <= now:
+                due.append(player_id)
+        if not due:
+            return
+        _LOGGER.debug(f"{DOMAIN} - Checking silent players: {due}")
+        self._checking = True
+        try:
+            await self._check(due)
+        finally:
+            self._checking = False
+            for player_id in due:
+                state = self._players[player_id]
+                if state.next_check is None:
+                    # Reported over MQTT while the check ran.
+                    continue
+                state.next_check = now + state.interval
+                state.interval = min(
+                    state.interval * BACKOFF_FACTOR, self._max_interval
+                )
@@ -0,0 +1,100 @@
+"""Resolved media cache for Yoto integration."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.components.media_source import PlayMedia, Unresolvable
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .utils import signed_url_expiry, split_media_id
+
+if TYPE_CHECKING:
+    from .coordinator import YotoDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Refresh signed track URLs this long before they expire, so a player that
+# starts streaming right away does not get a URL that lapses under it.
+REFRESH_MARGIN = timedelta(minutes=5)
+
+MIME_TYPES = {
+    "aac": "audio/aac",
+    "mp3": "audio/mpeg",
+    "opus": "audio/opus",
+}
+
+
+@dataclass(slots=True)
+class _ResolvedMedia:
+    """A resolved media id and when its signed URL stops working."""
+
+    play_media: PlayMedia
+    expires: datetime | None
+
+    @property
+    def fresh(self) -> bool:
+        """Return whether the URL is good for at least REFRESH_MARGIN."""
+        return self.expires is None or dt_util.utcnow() < self.expires - REFRESH_MARGIN
+
+
+class YotoResolveCache:
+    """Resolve media ids to track URLs, reusing results until near expiry.
+
+    Entries are grouped by card and dropped when the card's details are
+    fetched again, since that hands out new signed URLs.
+    """
+
+    def __init__(self, coordinator: YotoDataUpdateCoordinator) -> None:
+        """Initialize."""
+        self._coordinator = coordinator
+        self._cards: dict[str, dict[str, _ResolvedMedia]] = {}
+
+    def invalidate_card(self, card_id: str) -> None:
+        """Drop the resolved media of a card after its details changed."""
+        self._cards.pop(card_id, None)
+
+    async def async_resolve(self, media_id: str) -> PlayMedia:
+        """Return the PlayMedia for a card, chapter or track media id."""
+        card_id = split_media_id(media_id)[0]
+        entry = self._cards.get(card_id, {}).get(media_id)
+        if entry is not None and entry.fresh:
+            return entry.play_media
+        if (card := self._coordinator.yoto_manager.library.get(card_id)) is None:
+            raise Unresolvable(f"Card {card_id} is not in the Yoto library")
+        if not card.chapters:
+            await self._coordinator.async_update_card_detail(card_id)
+        entry = self._resolve(media_id)
+        if not entry.fresh:
+            # Details restored from disk or fetched long ago carry lapsed URLs.
+            await self._coordinator.async_update_card_detail(card_id)
+            entry = self._resolve(media_id)
+        # Fetching invalidates the card's entries, so store after any fetch.
+        self._cards.setdefault(card_id, {})[media_id] = entry
+        return entry.play_media
+
+    def _resolve(self, media_id: str) -> _ResolvedMedia:
+        """Look up the track a media id points at."""
+        card_id, chapter_key, track_key, _ = split_media_id(media_id)
+        try:
+            chapters = self._coordinator.yoto_manager.library[card_id].chapters or {}
+            if chapter_key is None:
+                chapter_key = next(iter(chapters))
+            tracks = chapters[chapter_key].tracks or {}
+            if track_key is None:
+                track_key = next(iter(tracks))
+            track = tracks[track_key]
+        except (KeyError, StopIteration) as ex:
+            raise Unresolvable(f"No track found for {media_id}") from ex
+        if (mime_type := MIME_TYPES.get(track.format)) is None:
+            _LOGGER.error(
+                f"Unknown track format: {track.format}. Report this to the developer on GitHub."
+            )
+            raise Unresolvable(f"Unknown track format: {track.format}")
+        expires = signed_url_expiry(track.trackUrl)
+        _LOGGER.debug(f"{DOMAIN} - Resolved {media_id}, expires {expires}")
+        return _ResolvedMedia(PlayMedia(track.trackUrl, mime_type), expires)
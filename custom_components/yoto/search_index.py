@@ -0,0 +1,135 @@
+"""Library search for Yoto integration."""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import re
+import unicodedata
+from typing import Any
+
+from yoto_api.Card import Card
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+WORD_RE = re.compile(r"\w+")
+
+
+def _words(text: str | None) -> list[str]:
+    """Split text into case and accent folded words."""
+    if not text:
+        return []
+    folded = unicodedata.normalize("NFKD", text.casefold())
+    return WORD_RE.findall(
+        "".join(char for char in folded if not unicodedata.combining(char))
+    )
+
+
+def _card_signature(card: Card) -> tuple[Any, ...]:
+    """Return the searchable content of a card, to skip unchanged cards."""
+    return (
+        card.title,
+        card.author,
+        tuple(
+            (
+                chapter.key,
+                chapter.title,
+                tuple(
+                    (track.key, track.title)
+                    for track in (chapter.tracks or {}).values()
+                ),
+            )
+            for chapter in (card.chapters or {}).values()
+        ),
+    )
+
+
+class YotoSearchIndex:
+    """Inverted index over card titles and authors and chapter and track titles.
+
+    Items are media ids (``card``, ``card+chapter`` or ``card+chapter+track``)
+    listed under each word of their text. Cards are re-indexed one at a time
+    when the library listing or their details change.
+    """
+
+    def __init__(self, library: dict[str, Card]) -> None:
+        """Initialize."""
+        self._library = library
+        self._postings: dict[str, set[str]] = {}
+        self._card_items: dict[str, dict[str, set[str]]] = {}
+        self._card_signatures: dict[str, tuple[Any, ...]] = {}
+        self._titles: dict[str, str] = {}
+        self._vocabulary: list[str] | None = None
+
+    def library_updated(self) -> None:
+        """Index added or changed cards and drop removed ones."""
+        for card_id in self._card_items.keys() - self._library.keys():
+            self._remove_card(card_id)
+        for card_id in self._library:
+            self.card_updated(card_id)
+
+    def card_updated(self, card_id: str) -> None:
+        """Re-index a card if its searchable content changed."""
+        card = self._library[card_id]
+        signature = _card_signature(card)
+        if self._card_signatures.get(card_id) == signature:
+            return
+        self._remove_card(card_id)
+        self._card_signatures[card_id] = signature
+        items = {card_id: set(_words(card.title)) | set(_words(card.author))}
+        self._titles[card_id] = (card.title or "").casefold()
+        for chapter in (card.chapters or {}).values():
+            chapter_id = f"{card_id}+{chapter.key}"
+            items[chapter_id] = set(_words(chapter.title))
+            self._titles[chapter_id] = (chapter.title or "").casefold()
+            for track in (chapter.tracks or {}).values():
+                track_id = f"{chapter_id}+{track.key}"
+                items[track_id] = set(_words(track.title))
+                self._titles[track_id] = (track.title or "").casefold()
+        for item, words in items.items():
+            for word in words:
+                if word not in self._postings:
+                    self._postings[word] = set()
+                    self._vocabulary = None
+                self._postings[word].add(item)
+        self._card_items[card_id] = items
+
+    def _remove_card(self, card_id: str) -> None:
+        self._card_signatures.pop(card_id, None)
+        for item, words in self._card_items.pop(card_id, {}).items():
+            del self._titles[item]
+            for word in words:
+                postings = self._postings[word]
+                postings.discard(item)
+                if not postings:
+                    del self._postings[word]
+                    self._vocabulary = None
+
+    def search(self, query: str, limit: int) -> list[str]:
+        """Return media ids matching every word of the query.
+
+        The last word also matches as a prefix, so results show up while the
+        query is still being typed. Cards come first, then chapters, then
+        tracks, each sorted by title.
+        """
+        *words, prefix = _words(query) or [""]
+        if not prefix:
+            return []
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        vocabulary = self._vocabulary
+        candidates: set[str] = set()
+        for index in range(bisect.bisect_left(vocabulary, prefix), len(vocabulary)):
+            if not vocabulary[index].startswith(prefix):
+                break
+            candidates |= self._postings[vocabulary[index]]
+        for word in sorted(words, key=lambda word: len(self._postings.get(word, ()))):
+            if not candidates:
+                break
+            candidates &= self._postings.get(word, set())
+        _LOGGER.debug(f"{DOMAIN} - Search for {query!r} matched {len(candidates)}")
+        return sorted(
+            candidates, key=lambda item: (item.count("+"), self._titles[item], item)
+        )[:limit]
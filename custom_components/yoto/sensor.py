@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Final
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any, Final
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -16,15 +18,27 @@ from homeassistant.const import (
     PERCENTAGE,
     SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
     EntityCategory,
+    Platform,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from yoto_api import YotoPlayer
 
-from .const import DOMAIN
+from .const import (
+    CONF_AMBIENT_LIGHT_DEADBAND,
+    CONF_SENSOR_MIN_INTERVAL,
+    CONF_TEMPERATURE_DEADBAND,
+    CONF_WIFI_STRENGTH_DEADBAND,
+    DEFAULT_AMBIENT_LIGHT_DEADBAND,
+    DEFAULT_SENSOR_MIN_INTERVAL,
+    DEFAULT_TEMPERATURE_DEADBAND,
+    DEFAULT_WIFI_STRENGTH_DEADBAND,
+    SENSOR_MAX_INTERVAL,
+)
 from .coordinator import YotoConfigEntry
-from .entity import YotoEntity
+from .entity import YotoEntity, async_disabled_unique_ids, entity_unique_id
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,6 +48,16 @@ class YotoSensorEntityDescription(SensorEntityDescription):
     """Describe Yoto sensor entity."""
 
     always_load: bool = False
+    # Readings that fluctuate are written only when they move by at least the
+    # deadband, and at most once per minimum interval. The option keys name
+    # config entry options that override the defaults.
+    deadband: float = 0
+    deadband_option: str | None = None
+    min_interval: timedelta = timedelta(0)
+    min_interval_option: str | None = None
+
+
+TELEMETRY_MIN_INTERVAL = timedelta(seconds=DEFAULT_SENSOR_MIN_INTERVAL)
 
 
 SENSOR_DESCRIPTIONS: Final[tuple[YotoSensorEntityDescription, ...]] = (
@@ -56,17 +80,29 @@ SENSOR_DESCRIPTIONS: Final[tuple[YotoSensorEntityDescription, ...]] = (
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         device_class=SensorDeviceClass.TEMPERATURE,
         entity_category=EntityCategory.DIAGNOSTIC,
+        deadband=DEFAULT_TEMPERATURE_DEADBAND,
+        deadband_option=CONF_TEMPERATURE_DEADBAND,
+        min_interval=TELEMETRY_MIN_INTERVAL,
+        min_interval_option=CONF_SENSOR_MIN_INTERVAL,
     ),
     YotoSensorEntityDescription(
         key="ambient_light_sensor_reading",
         native_unit_of_measurement=LIGHT_LUX,
         device_class=SensorDeviceClass.ILLUMINANCE,
+        deadband=DEFAULT_AMBIENT_LIGHT_DEADBAND,
+        deadband_option=CONF_AMBIENT_LIGHT_DEADBAND,
+        min_interval=TELEMETRY_MIN_INTERVAL,
+        min_interval_option=CONF_SENSOR_MIN_INTERVAL,
     ),
     YotoSensorEntityDescription(
         key="wifi_strength",
         device_class=SensorDeviceClass.SIGNAL_STRENGTH,
         native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
         entity_category=EntityCategory.DIAGNOSTIC,
+        deadband=DEFAULT_WIFI_STRENGTH_DEADBAND,
+        deadband_option=CONF_WIFI_STRENGTH_DEADBAND,
+        min_interval=TELEMETRY_MIN_INTERVAL,
+        min_interval_option=CONF_SENSOR_MIN_INTERVAL,
     ),
     YotoSensorEntityDescription(
         key="battery_temperature",
@@ -75,6 +111,10 @@ SENSOR_DESCRIPTIONS: Final[tuple[YotoSensorEntityDescription, ...]] = (
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
+        deadband=DEFAULT_TEMPERATURE_DEADBAND,
+        deadband_option=CONF_TEMPERATURE_DEADBAND,
+        min_interval=TELEMETRY_MIN_INTERVAL,
+        min_interval_option=CONF_SENSOR_MIN_INTERVAL,
     ),
 )
 
@@ -86,29 +126,44 @@ async def async_setup_entry(
 ) -> None:
     """Set up sensor platform."""
     coordinator = config_entry.runtime_data
-    entities: list[YotoSensor] = []
-    for player_id in coordinator.yoto_manager.players.keys():
-        player: YotoPlayer = coordinator.yoto_manager.players[player_id]
-        for description in SENSOR_DESCRIPTIONS:
-            if (
+    disabled = async_disabled_unique_ids(hass, config_entry, Platform.SENSOR)
+
+    @callback
+    def _async_add_player(player: YotoPlayer) -> None:
+        # Some readings only arrive over MQTT, so wait for the player to report.
+        async_add_entities(
+            YotoSensor(coordinator, description, player)
+            for description in SENSOR_DESCRIPTIONS
+            if entity_unique_id(player.id, description.key) not in disabled
+            and (
                 getattr(player, description.key, None) is not None
                 or description.always_load
-            ):
-                entities.append(YotoSensor(coordinator, description, player))
-    async_add_entities(entities)
+            )
+        )
+
+    for player in coordinator.yoto_manager.players.values():
+        coordinator.async_on_player_ready(player.id, partial(_async_add_player, player))
+
+
+def _as_number(value: Any) -> float | None:
+    """Return a reading as a number, or None if it is not numeric."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
 
 
 class YotoSensor(SensorEntity, YotoEntity):
     """Yoto sensor class."""
 
     def __init__(
-        self, coordinator, description: SensorEntityDescription, player: YotoPlayer
+        self, coordinator, description: YotoSensorEntityDescription, player: YotoPlayer
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, player)
         self._description = description
         self._key = self._description.key
-        self._attr_unique_id = f"{DOMAIN}_{player.id}_{self._key}"
+        self._attr_unique_id = entity_unique_id(player.id, self._key)
         self._attr_state_class = self._description.state_class
         self._attr_device_class = self._description.device_class
         self._attr_entity_category = self._description.entity_category
@@ -116,11 +171,85 @@ class YotoSensor(SensorEntity, YotoEntity):
             description.entity_registry_enabled_default
         )
         self._attr_translation_key = self._description.translation_key
+        self._watched_fields = frozenset({self._key})
+        options = coordinator.config_entry.options
+        self._deadband: float = options.get(
+            description.deadband_option, description.deadband
+        )
+        self._min_interval = (
+            timedelta(seconds=options[description.min_interval_option])
+            if description.min_interval_option in options
+            else description.min_interval
+        )
+        # Value last handed to the state machine, and when (loop time).
+        self._value = getattr(self.snapshot, self._key)
+        self._written_at: float | None = None
+        self._unsub_retry: CALLBACK_TYPE | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Count the first state write towards the minimum interval."""
+        await super().async_added_to_hass()
+        self._written_at = self.hass.loop.time()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending held write."""
+        await super().async_will_remove_from_hass()
+        if self._unsub_retry is not None:
+            self._unsub_retry()
+            self._unsub_retry = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        value = getattr(self.snapshot, self._key)
+        if value != self._value and not self._should_write(value):
+            self.coordinator.state_writes.skipped += 1
+            return
+        self._value = value
+        super()._handle_coordinator_update()
+
+    def _should_write(self, value: Any) -> bool:
+        """Return whether a changed reading is worth a state write now.
+
+        A reading held back by the minimum interval is written when the
+        interval has passed.
+        """
+        if not self._deadband and not self._min_interval:
+            return True
+        now = self.hass.loop.time()
+        if self._written_at is not None:
+            since_write = now - self._written_at
+            new, old = _as_number(value), _as_number(self._value)
+            if (
+                new is not None
+                and old is not None
+                and abs(new - old) < self._deadband
+                and since_write < SENSOR_MAX_INTERVAL.total_seconds()
+            ):
+                return False
+            if since_write < self._min_interval.total_seconds():
+                if self._unsub_retry is None:
+                    self._unsub_retry = async_call_later(
+                        self.hass,
+                        self._min_interval.total_seconds() - since_write,
+                        self._async_write_held,
+                    )
+                return False
+        self._written_at = now
+        return True
+
+    @callback
+    def _async_write_held(self, _now: datetime) -> None:
+        """Write a reading the minimum interval held back."""
+        self._unsub_retry = None
+        self._handle_coordinator_update()
+
+    def _state_fingerprint(self) -> tuple[Any, ...]:
+        return (self.available, self._value)
 
     @property
     def native_value(self):
         """Return the value reported by the sensor."""
-        return getattr(self.player, self._key)
+        return self._value
 
     @property
     def native_unit_of_measurement(self) -> str | None:
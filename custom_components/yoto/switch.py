@@ -3,17 +3,16 @@
 from __future__ import annotations
 
 import logging
-from typing import Final
+from typing import Any, Final
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
-from homeassistant.const import EntityCategory
+from homeassistant.const import EntityCategory, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from yoto_api import YotoPlayer
 
-from .const import DOMAIN
 from .coordinator import YotoConfigEntry
-from .entity import YotoEntity
+from .entity import YotoEntity, async_disabled_unique_ids, entity_unique_id
 from .utils import parse_key
 
 _LOGGER = logging.getLogger(__name__)
@@ -44,20 +43,27 @@ async def async_setup_entry(
 ) -> None:
     """Set up sensor platform."""
     coordinator = config_entry.runtime_data
+    disabled = async_disabled_unique_ids(hass, config_entry, Platform.SWITCH)
     entities: list[YotoSwitch] = []
     for player_id in coordinator.yoto_manager.players.keys():
         player: YotoPlayer = coordinator.yoto_manager.players[player_id]
-        for index in range(len(player.config.alarms)):
-            alarm_description = SwitchEntityDescription(
+        descriptions = [
+            SwitchEntityDescription(
                 key="alarms[" + str(index) + "]",
                 translation_key="alarm",
                 translation_placeholders={"number": str(index + 1)},
                 entity_category=EntityCategory.CONFIG,
             )
-            entities.append(YotoSwitch(coordinator, alarm_description, player))
-
-        for description in SENSOR_DESCRIPTIONS:
-            entities.append(YotoSwitch(coordinator, description, player))
+            for index in range(
+                len(coordinator.snapshots[player.id].config.alarms_enabled)
+            )
+        ]
+        descriptions.extend(SENSOR_DESCRIPTIONS)
+        entities.extend(
+            YotoSwitch(coordinator, description, player)
+            for description in descriptions
+            if entity_unique_id(player.id, f"switch_{description.key}") not in disabled
+        )
     async_add_entities(entities)
 
 
@@ -71,13 +77,27 @@ class YotoSwitch(SwitchEntity, YotoEntity):
         super().__init__(coordinator, player)
         self._description = description
         self._key = self._description.key
-        self._attr_unique_id = f"{DOMAIN}_{player.id}_switch_{self._key}"
+        self._attr_unique_id = entity_unique_id(player.id, f"switch_{self._key}")
         if self._key.startswith("alarms"):
-            self._attribute, self._index = parse_key(self._key)
+            _, self._index = parse_key(self._key)
         self._attr_translation_key = self._description.translation_key
         if description.translation_placeholders:
             self._attr_translation_placeholders = description.translation_placeholders
         self._attr_entity_category = description.entity_category
+        if self._key == "end_of_track_sleep":
+            self._watched_fields = frozenset(
+                {
+                    "track_length",
+                    "track_position",
+                    "sleep_timer_active",
+                    "sleep_timer_seconds_remaining",
+                }
+            )
+        else:
+            self._watched_fields = frozenset({"config"})
+
+    def _state_fingerprint(self) -> tuple[Any, ...]:
+        return (self.available, self.is_on)
 
     @property
     def is_on(self) -> bool | None:
@@ -86,21 +106,22 @@ class YotoSwitch(SwitchEntity, YotoEntity):
             self._key == "night_display_brightness"
             or self._key == "day_display_brightness"
         ):
-            if getattr(self.player.config, self._key) == "auto":
+            if getattr(self.snapshot.config, self._key) == "auto":
                 return True
             else:
                 return False
         elif self._key == "end_of_track_sleep":
+            snapshot = self.snapshot
             if (
-                self.player.track_length is not None
-                and self.player.track_position is not None
+                snapshot.track_length is not None
+                and snapshot.track_position is not None
             ):
-                seconds_to_end = self.player.track_length - self.player.track_position
-                if abs(self.player.sleep_timer_seconds_remaining - seconds_to_end) <= 5:
+                seconds_to_end = snapshot.track_length - snapshot.track_position
+                if abs(snapshot.sleep_timer_seconds_remaining - seconds_to_end) <= 5:
                     return True
             return False
         elif self._key.startswith("alarms"):
-            return getattr(self.player.config, self._attribute)[self._index].enabled
+            return self.snapshot.config.alarms_enabled[self._index]
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn the entity off."""
@@ -127,11 +148,12 @@ class YotoSwitch(SwitchEntity, YotoEntity):
                 self.player.id, self._key, "auto"
             )
         elif self._key == "end_of_track_sleep":
+            snapshot = self.snapshot
             if (
-                self.player.track_length is not None
-                and self.player.track_position is not None
+                snapshot.track_length is not None
+                and snapshot.track_position is not None
             ):
-                seconds_to_end = self.player.track_length - self.player.track_position
+                seconds_to_end = snapshot.track_length - snapshot.track_position
                 await self.coordinator.async_set_sleep_timer(
                     self.player.id, seconds_to_end
                 )
@@ -3,17 +3,16 @@
 from __future__ import annotations
 
 from datetime import time
-from typing import Final
+from typing import Any, Final
 
 from homeassistant.components.time import TimeEntity, TimeEntityDescription
-from homeassistant.const import EntityCategory
+from homeassistant.const import EntityCategory, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from yoto_api import YotoPlayer
 
-from .const import DOMAIN
 from .coordinator import YotoConfigEntry, YotoDataUpdateCoordinator
-from .entity import YotoEntity
+from .entity import YotoEntity, async_disabled_unique_ids, entity_unique_id
 
 TIME_DESCRIPTIONS: Final[tuple[TimeEntityDescription, ...]] = (
     TimeEntityDescription(
@@ -36,11 +35,16 @@ async def async_setup_entry(
 ) -> None:
     """Set up time platform."""
     coordinator = config_entry.runtime_data
+    disabled = async_disabled_unique_ids(hass, config_entry, Platform.TIME)
     entities: list[YotoTime] = []
     for player_id in coordinator.yoto_manager.players.keys():
         player: YotoPlayer = coordinator.yoto_manager.players[player_id]
         for description in TIME_DESCRIPTIONS:
-            if getattr(player.config, description.key, None) is not None:
+            if (
+                entity_unique_id(player.id, description.key) not in disabled
+                and getattr(coordinator.snapshots[player.id].config, description.key)
+                is not None
+            ):
                 entities.append(YotoTime(coordinator, description, player))
     async_add_entities(entities)
 
@@ -58,14 +62,18 @@ class YotoTime(TimeEntity, YotoEntity):
         super().__init__(coordinator, player)
         self._description = description
         self._key = self._description.key
-        self._attr_unique_id = f"{DOMAIN}_{player.id}_{self._description.key}"
+        self._attr_unique_id = entity_unique_id(player.id, self._description.key)
         self._attr_translation_key = self._description.translation_key
         self._attr_entity_category = description.entity_category
+        self._watched_fields = frozenset({"config"})
+
+    def _state_fingerprint(self) -> tuple[Any, ...]:
+        return (self.available, self.native_value)
 
     @property
     def native_value(self) -> time | None:
         """Return the value reported by the sensor."""
-        return getattr(self.player.config, self._key)
+        return getattr(self.snapshot.config, self._key)
 
     async def async_set_value(self, value: time) -> None:
         """Update the current time."""
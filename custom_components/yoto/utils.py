@@ -2,25 +2,12 @@
 
 import logging
 import re
+from datetime import UTC, datetime
+from urllib.parse import parse_qs, urlsplit
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def rgetattr(obj: object, attr: str) -> object:
-    """Recursively get nested attributes."""
-    _this_func = rgetattr
-    sp = attr.split(".", 1)
-    if len(sp) == 1:
-        left, right = sp[0], ""
-    else:
-        left, right = sp
-
-    obj = getattr(obj, left)
-    if right:
-        obj = _this_func(obj, right)
-    return obj
-
-
 def split_media_id(text: str) -> tuple[str, str | None, str | None, int]:
     """Split media id into components.
 
@@ -59,3 +46,13 @@ def parse_key(text: str) -> tuple[str, int] | None:
         object2 = int(match.group(2))  # This will be 1
         return object1, object2
     return None
+
+
+def signed_url_expiry(url: str | None) -> datetime | None:
+    """Return when a signed media URL stops working, if it carries an expiry."""
+    if not url:
+        return None
+    expires = parse_qs(urlsplit(url).query).get("Expires")
+    if not expires or not expires[0].isdigit():
+        return None
+    return datetime.fromtimestamp(int(expires[0]), UTC)
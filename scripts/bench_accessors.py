@@ -0,0 +1,102 @@
+"""Time number and light state reads: rgetattr against the entity accessors.
+
+Run from the repository root with Home Assistant and yoto_api installed:
+
+    python scripts/bench_accessors.py
+
+Each round is what one state write of a display brightness number and an
+ambient colour light reads: native_value, is_on and rgb_color. The new path
+reads the properties of real YotoNumber and YotoLight entities; the old path
+is the removed rgetattr code, kept here as the baseline.
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from yoto_api import YotoPlayer, YotoPlayerConfig  # noqa: E402
+
+from custom_components.yoto import light, number  # noqa: E402
+from custom_components.yoto.player_snapshot import PlayerSnapshot  # noqa: E402
+
+NUMBER_KEY = "config.day_display_brightness"
+LIGHT_KEY = "config.day_ambient_colour"
+ROUNDS = 200_000
+
+
+def rgetattr(obj: object, attr: str) -> object:
+    """Recursively get nested attributes (the removed utils helper)."""
+    sp = attr.split(".", 1)
+    if len(sp) == 1:
+        left, right = sp[0], ""
+    else:
+        left, right = sp
+    obj = getattr(obj, left)
+    if right:
+        obj = rgetattr(obj, right)
+    return obj
+
+
+def make_player() -> YotoPlayer:
+    """Return a player with the config the benchmark reads."""
+    player = YotoPlayer(id="bench")
+    player.config = YotoPlayerConfig()
+    player.config.day_display_brightness = "auto"
+    player.config.day_ambient_colour = "#40bfd9"
+    return player
+
+
+def old_round(player: YotoPlayer) -> None:
+    """Read the entity values the way the platforms used to."""
+    if rgetattr(player, NUMBER_KEY) == "auto":
+        _ = 100
+    else:
+        _ = rgetattr(player, NUMBER_KEY)
+    _ = rgetattr(player, LIGHT_KEY) != light.OFF_COLOUR
+    hex_val = rgetattr(player, LIGHT_KEY).lstrip("#")
+    _ = tuple(int(hex_val[i : i + 2], 16) for i in (0, 2, 4))
+
+
+def make_entities(player: YotoPlayer) -> tuple[number.YotoNumber, light.YotoLight]:
+    """Return the number and light entities, reading a snapshot of player.
+
+    The entities only need the coordinator for its snapshots.
+    """
+    coordinator = SimpleNamespace(
+        snapshots={player.id: PlayerSnapshot.from_player(player)}
+    )
+    brightness = next(d for d in number.SENSOR_DESCRIPTIONS if d.key == NUMBER_KEY)
+    colour = next(d for d in light.SENSOR_DESCRIPTIONS if d.key == LIGHT_KEY)
+    return (
+        number.YotoNumber(coordinator, brightness, player),
+        light.YotoLight(coordinator, colour, player),
+    )
+
+
+def new_round(brightness: number.YotoNumber, colour: light.YotoLight) -> None:
+    """Read the entity values through the entities' own properties."""
+    _ = brightness.native_value
+    _ = colour.is_on
+    _ = colour.rgb_color
+
+
+def main() -> None:
+    """Print the best per-round time of each path."""
+    player = make_player()
+    brightness, colour = make_entities(player)
+    assert brightness.native_value == 100 and colour.rgb_color == (64, 191, 217)
+    for name, func in (
+        ("rgetattr + parse", lambda: old_round(player)),
+        ("entity accessors", lambda: new_round(brightness, colour)),
+    ):
+        best = min(timeit.repeat(func, number=ROUNDS, repeat=5))
+        print(f"{name}: {best / ROUNDS * 1e9:.0f} ns per round")
+
+
+if __name__ == "__main__":
+    main()